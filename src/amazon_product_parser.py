@@ -8,7 +8,11 @@ Amazon Product Parser - 亚马逊产品信息解析工具类
 设计原则: Single Source of Truth, Good Taste, No Duplication
 """
 
+import logging
+import os
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from playwright.sync_api import Page
 from product_data import ProductData
@@ -16,6 +20,351 @@ from product_data import ProductData
 
 # ProductData 现在从 product_data.py 导入，不再重复定义
 
+# Playwright每次API调用都会走帧栈采集（_capture_stack_trace），本解析器
+# 每页发起数百次调用，这部分是纯开销（采集结果只用于trace和错误消息里的
+# apiName）。默认跳过采集；设置 PW_INSPECT_STACK=1 可恢复完整栈以便调试。
+if os.environ.get('PW_INSPECT_STACK', '0') != '1':
+    try:
+        # _sync_base/_disposable/_network 在导入时用 from-import 各自持有
+        # 一份 _capture_stack_trace 绑定，只改 _connection 不会生效，
+        # 四个模块都要重绑
+        from playwright._impl import _connection as _pw_connection
+        from playwright._impl import _disposable as _pw_disposable
+        from playwright._impl import _network as _pw_network
+        from playwright._impl import _sync_base as _pw_sync_base
+
+        def _no_stack_trace(*args, **kwargs):
+            # 宽容签名：私有函数未来加参数时不至于让每次调用抛TypeError
+            return {"frames": [], "apiName": "", "title": None}
+
+        for _pw_mod in (_pw_connection, _pw_disposable, _pw_network, _pw_sync_base):
+            _pw_mod._capture_stack_trace = _no_stack_trace
+    except Exception:
+        # 私有API随版本变动时静默退回Playwright默认行为
+        pass
+
+# 价格文本校验正则 - 单次扫描替代 replace().replace().isdigit() 的三次扫描
+_PRICE_RE = re.compile(r'^\$?\s*([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?|[0-9]+(?:\.[0-9]+)?|\.[0-9]+)$')
+
+# 尺寸字符串中的数字提取正则 - 配合finditer按需取前三个
+_NUM_RE = re.compile(r'([0-9]*\.?[0-9]+)')
+
+# 批量解析时逐条print会拖慢紧循环，诊断输出走DEBUG级别日志，
+# 且统一用%占位的惰性格式化——级别未启用时连字符串插值都不发生
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# 一次DOM遍历收割全部twister规格: [{dimension_name, selected_value, available_options}, ...]
+# 整个收割在浏览器内完成，Python侧只消费返回的JSON
+_TWISTER_HARVEST_JS = """
+() => {
+    return Array.from(
+        document.querySelectorAll("span[id^='inline-twister-expanded-dimension-text-']")
+    ).map(span => {
+        const dim = span.id.replace('inline-twister-expanded-dimension-text-', '');
+        const row = document.getElementById('inline-twister-row-' + dim);
+        const items = [];
+        if (row) {
+            row.querySelectorAll('ul.dimension-values-list li').forEach(li => {
+                const img = li.querySelector('img');
+                const alt = img ? img.getAttribute('alt') : null;
+                if (alt) {
+                    if (!items.includes(alt)) items.push(alt);
+                } else {
+                    const t = li.innerText.split('\\n').map(s => s.trim())
+                        .find(s => s && !s.includes('$') && s.length < 50);
+                    if (t && !items.includes(t)) items.push(t);
+                }
+            });
+        }
+        return {
+            dimension_name: dim,
+            selected_value: span.innerText.trim(),
+            available_options: items
+        };
+    });
+}
+"""
+
+# 规格选项选择器级联 - 在浏览器内按原优先级顺序尝试4个选择器并去重，
+# 替代Python侧逐选择器、逐元素的count/nth/get_attribute往返
+_OPTION_CASCADE_JS = """
+(row) => {
+    const short = t => t.split('\\n').map(s => s.trim())
+        .find(s => s && !s.includes('$') && s.length < 50) || null;
+    const selectors = [
+        'ul.dimension-values-list li[data-asin]',
+        'ul.dimension-values-list li img.swatch-image',
+        'ul.dimension-values-list li .a-button',
+        'ul.dimension-values-list li'
+    ];
+    for (let si = 0; si < selectors.length; si++) {
+        const els = row.querySelectorAll(selectors[si]);
+        if (!els.length) continue;
+        const options = [];
+        const seen = new Set();
+        els.forEach(el => {
+            let value = null;
+            if (si === 0) {
+                const img = el.querySelector('img');
+                value = img ? img.getAttribute('alt') : null;
+                if (!value) {
+                    const btn = el.querySelector('.a-button .a-button-text');
+                    if (btn) value = short(btn.innerText);
+                }
+            } else if (si === 1) {
+                value = el.getAttribute('alt');
+            } else if (si === 2) {
+                const img = el.querySelector('img');
+                value = img ? img.getAttribute('alt') : short(el.innerText);
+            } else if (el.getAttribute('data-asin')) {
+                const img = el.querySelector('img');
+                if (img) value = img.getAttribute('alt');
+            }
+            if (value && !seen.has(value)) {
+                seen.add(value);
+                options.push(value);
+            }
+        });
+        if (options.length) return options;
+    }
+    return [];
+}
+"""
+
+# 一次evaluate探测选中值的全部来源字段，替代逐策略3-4次CDP往返
+_SELECTED_SPEC_PROBE_JS = """
+(row, dim) => {
+    const expanded = row.querySelector('#inline-twister-expanded-dimension-text-' + dim);
+    const btn = row.querySelector('.a-button-selected');
+    const btnImg = btn ? btn.querySelector('img') : null;
+    const radio = row.querySelector("li[data-asin]:has(input[aria-checked='true'])");
+    const radioImg = radio ? radio.querySelector('img') : null;
+    return {
+        selectedText: expanded ? expanded.innerText.trim() : '',
+        buttonAlt: btnImg ? (btnImg.getAttribute('alt') || '') : '',
+        buttonText: btn ? btn.innerText.trim() : '',
+        radioAlt: radioImg ? (radioImg.getAttribute('alt') || '') : '',
+        radioText: radio ? radio.innerText.trim() : ''
+    };
+}
+"""
+
+# 维度字母到结果下标的映射表 - 表查找替代if/elif分支链
+_DIM_TABLE = {'D': 0, 'L': 0, 'W': 1, 'H': 2}
+_DIM_LABELS = ('深度', '宽度', '高度')
+
+# 首个不含价格的短文本行（去除首尾空白后1-49字符）- 一次C级正则扫描
+# 替代split('\\n')的列表分配加Python逐行循环
+_FIRST_SHORT_NONPRICE_RE = re.compile(r'(?m)^[^\S\n]*([^$\s][^$\n]{0,48}?)[^\S\n]*$')
+
+# 一次evaluate取回整张表的 [th, td] 文本对，替代逐行count/nth/inner_text往返
+_TABLE_ROWS_JS = (
+    "t => Array.from(t.querySelectorAll('tr')).map(tr => {"
+    " const th = tr.querySelector('th');"
+    " const td = tr.querySelector('td');"
+    " return th && td ? [th.innerText.trim(), td.innerText.trim()] : null;"
+    " }).filter(Boolean)"
+)
+
+# 一趟点开全部未展开的详情展开器 - querySelectorAll天然对重叠选择器去重
+_EXPAND_SECTIONS_JS = """
+() => {
+    const headers = document.querySelectorAll(
+        "a.a-expander-header[data-action='a-expander-toggle'],"
+        + " .a-expander-container .a-expander-header,"
+        + " [data-action='a-expander-toggle']"
+    );
+    let n = 0;
+    headers.forEach(h => {
+        if (h.getAttribute('aria-expanded') !== 'true') {
+            h.click();
+            n++;
+        }
+    });
+    return n;
+}
+"""
+
+# 按前两个单元格取对的表格收割JS - 适配无th的 td/td 结构表格
+_CELL_PAIRS_JS = (
+    "el => Array.from(el.querySelectorAll('tr')).map(tr => {"
+    " const c = tr.children;"
+    " return c.length >= 2 ? [c[0].innerText.trim(), c[1].innerText.trim()] : null;"
+    " }).filter(Boolean)"
+)
+
+# 一次evaluate取回glance区域全部 [标题, 值] 文本对
+_GLANCE_PAIRS_JS = (
+    "el => Array.from(el.querySelectorAll('span.a-text-bold')).map(b => {"
+    " const td = b.closest('td');"
+    " const v = td ? td.querySelector('span.handle-overflow:not(.a-text-bold)') : null;"
+    " return v ? [b.innerText.trim(), v.innerText.trim()] : null;"
+    " }).filter(Boolean)"
+)
+
+# 重量选择器级联 - :has-text 是Playwright扩展，querySelectorAll不支持，
+# 改用等价的 td 文本包含判断；其余选择器原样保留
+_WEIGHT_SELECTORS = [
+    # 策略2a-2c: Item Weight 单元格（JS侧按文本过滤td后取其内文本）
+    "__item_weight_td__",
+    # 策略2d: 包含weight的所有元素
+    "[data-feature-name*='weight'], [id*='weight'], .weight-info",
+    # 策略2e: 产品详情表格中的重量
+    "#productDetails_detailBullets_sections1 span",
+]
+
+_WEIGHT_CASCADE_JS = """
+(sels) => {
+    const re = /([0-9.]+)\\s*(?:pounds?|lbs?)/i;
+    const probe = els => {
+        for (const el of els) {
+            const m = re.exec(el.innerText || '');
+            if (m) return m[1];
+        }
+        return null;
+    };
+    for (const sel of sels) {
+        let els;
+        if (sel === '__item_weight_td__') {
+            els = Array.from(document.querySelectorAll('td'))
+                .filter(td => td.innerText && td.innerText.includes('Item Weight'));
+        } else {
+            els = document.querySelectorAll(sel);
+        }
+        const hit = probe(els);
+        if (hit) return hit;
+    }
+    return null;
+}
+"""
+
+# 选中颜色选择器 - 低优先级选择器不限定维度，必须按优先级顺序回退，
+# 不能合并成一个逗号选择器取文档序首个匹配
+_SELECTED_COLOR_SELECTORS = [
+    # 策略1: 从展开的维度文本中获取
+    "#inline-twister-expanded-dimension-text-color_name",
+    # 策略2: 从颜色标题区域获取
+    ".inline-twister-dim-title-value",
+    # 策略3: 从选中的按钮获取
+    ".a-button-selected img[alt*='pack']",
+    # 策略4: 更通用的选中颜色选择器
+    "[id*='color_name'][class*='selected'] img",
+]
+
+# 浏览器内按策略优先级逐个尝试选择器，img取alt、其余取文本，
+# 返回首个非空结果 - 单次往返且保持原有回退顺序
+_SELECTED_COLOR_CASCADE_JS = """
+(sels) => {
+    for (const sel of sels) {
+        const el = document.querySelector(sel);
+        if (!el) continue;
+        const text = el.tagName === 'IMG'
+            ? el.getAttribute('alt')
+            : (el.innerText || '').trim();
+        if (text) return text;
+    }
+    return null;
+}
+"""
+
+# 选中包装数量选择器 - 同样必须保持优先级回退顺序
+_SELECTED_QUANTITY_SELECTORS = [
+    # 策略1: 从展开的维度文本中获取
+    "#inline-twister-expanded-dimension-text-item_package_quantity",
+    # 策略2: 从包装数量标题区域获取
+    "#inline-twister-dim-title-item_package_quantity .inline-twister-dim-title-value",
+    # 策略3: 从选中的按钮获取
+    ".a-button-selected .swatch-title-text-display",
+    # 策略4: 更通用的选中数量选择器
+    "[id*='item_package_quantity'][class*='selected'] .swatch-title-text",
+]
+
+# 数量文本的清洗在Python侧（_clean_quantity_text），清洗失败要能回退到
+# 下一策略，所以按优先级返回全部非空候选而不是只返回首个
+_SELECTED_QUANTITY_CASCADE_JS = """
+(sels) => {
+    const texts = [];
+    for (const sel of sels) {
+        const el = document.querySelector(sel);
+        if (!el) continue;
+        const text = (el.innerText || '').trim();
+        if (text) texts.push(text);
+    }
+    return texts;
+}
+"""
+
+# 智能提取各键名 - 进入提取套件前一次快照details成员关系
+_SMART_EXTRACT_KEYS = frozenset({'Material', 'Style', 'Max Weight Capacity', 'Room Type'})
+
+# 功能描述分词正则 - 一次findall构建token集合供关键词交集判断
+_TOKEN_RE = re.compile(r'[a-z][a-z-]+')
+
+# 重量/表格解析正则 - 模块级预编译，免去每次调用的re._cache查找
+_WEIGHT_NUM_RE = re.compile(r'([0-9.]+)')
+_WEIGHT_UNIT_RE = re.compile(r'([0-9.]+)\s*(?:pounds?|lbs?)', re.IGNORECASE)
+_WEIGHT_CAPACITY_RE = re.compile(r'(\d+)\s*(?:lb|lbs|pound|pounds)')
+_WS_RE = re.compile(r'\s+')
+
+# 颜色/数量文本清理正则 - 模块级预编译，避免每次调用重新解析模式
+_PACK_PREFIX_RE = re.compile(r'^\d+-pack\s+', re.IGNORECASE)
+_TRAILING_PUNCT_RE = re.compile(r'[.。]+$')
+_DIGIT_RE = re.compile(r'(\d+)')
+
+# 前缀剥离正则 - 锚定单次扫描，免去逐前缀startswith和lower()拷贝
+_COLOR_PREFIX_RE = re.compile(r'^(?:colou?r|selected color is)\s*:?\s*', re.IGNORECASE)
+_QTY_PREFIX_RE = re.compile(r'^(?:(?:item\s+)?package\s+quantity|quantity)\s*:\s*', re.IGNORECASE)
+
+# 固定字面量规格词的O(1)快速通道 - 多数真实输入可绕过正则引擎
+_TEXT_SPEC_LITERALS = frozenset({
+    'single', 'small', 'medium', 'large', 'xl', 'xxl',
+    'round', 'square', 'rectangular', 'oval',
+    'set', 'individual', 'pair',
+    'solid', 'striped', 'floral', 'geometric', 'abstract',
+    'storage', 'decorative', 'functional',
+})
+
+# 常见的文本规格模式 - 合并为单个交替正则，一次状态机扫描替代逐模式匹配
+_TEXT_SPEC_COMBINED = re.compile(
+    r'^(?:'
+    # 数量相关: 1-pack / 2 pack / single / pack of 3
+    r'\d+-pack'
+    r'|\d+\s*pack'
+    r'|single'
+    r'|pack\s*of\s*\d+'
+    # 尺寸相关: 12 inch / 5.5 cm / 12" / 12x18
+    r'|\d+(?:\.\d+)?\s*(?:inch|inches|cm|mm|ft|feet)'
+    r'|\d+(?:\.\d+)?"'
+    r'|\d+x\d+'
+    # 样式相关: 尺寸 / 形状 / 组合方式
+    r'|small|medium|large|xl|xxl'
+    r'|round|square|rectangular|oval'
+    r'|set|individual|pair'
+    # Pattern Name相关: 图案 / 功能类型
+    r'|solid|striped|floral|geometric|abstract'
+    r'|storage|decorative|functional'
+    r'|[a-z]+\s*(?:style|pattern|design)'  # 如 "storage style", "floral pattern"
+    r'|[a-z]+(?:-[a-z]+)*'  # 连字符分隔的单词，如 "solid-color", "multi-pattern"
+    r')$'
+)
+
+
+def _try_price(price_text: str) -> Optional[float]:
+    """
+    尝试从价格文本中解析出浮点价格
+
+    Args:
+        price_text: 原始价格文本，如 "$1,299.99"
+
+    Returns:
+        float: 解析成功的价格，失败返回None
+    """
+    m = _PRICE_RE.match(price_text.strip())
+    if m:
+        return float(m.group(1).replace(',', ''))
+    return None
+
 
 class AmazonProductParser:
     """
@@ -39,15 +388,48 @@ class AmazonProductParser:
             'weight_cell': "td:has-text('Item Weight')"
         }
         
-        # 智能提取关键词
+        # 智能提取关键词 - 元组保持基线列表的优先级顺序，多词命中时取位次靠前者
         self.keywords = {
-            'materials': ['bamboo', 'wood', 'metal', 'plastic', 'steel', 'aluminum', 'glass', 'fabric'],
-            'styles': ['modern', 'boho', 'scandinavian', 'industrial', 'rustic', 'minimalist', 'contemporary'],
-            'rooms': ['living room', 'bedroom', 'bathroom', 'office', 'kitchen', 'entryway'],
-            'assembly_no_tools': ['no hardware', 'tool-free', 'no screws', 'snap together'],
-            'assembly_required': ['assembly', 'install', 'assemble']
+            'materials': ('bamboo', 'wood', 'metal', 'plastic', 'steel', 'aluminum', 'glass', 'fabric'),
+            'styles': ('modern', 'boho', 'scandinavian', 'industrial', 'rustic', 'minimalist', 'contemporary'),
+            'rooms': ('living room', 'bedroom', 'bathroom', 'office', 'kitchen', 'entryway'),
+            'assembly_no_tools': ('no hardware', 'tool-free', 'no screws', 'snap together'),
+            'assembly_required': ('assembly', 'install', 'assemble')
         }
-    
+
+        # 每个类别预编译一个合并正则 - 单次扫描替代逐关键词的 in 检查。
+        # 不加\b词边界：基线是子串匹配（'wood'命中hardwood、
+        # 'living room'命中living rooms），长词优先避免短词遮蔽长词
+        self._keyword_patterns = {
+            category: re.compile(
+                '(' + '|'.join(map(re.escape, sorted(words, key=len, reverse=True))) + ')',
+                re.IGNORECASE,
+            )
+            for category, words in self.keywords.items()
+        }
+
+        # 单词类关键词 - 先走token集合的O(1)交集快速通道；
+        # 保持基线列表顺序，多词命中时两条通道取词优先级一致
+        self._single_word_keywords = {
+            category: words
+            for category, words in self.keywords.items()
+            if all(' ' not in word for word in words)
+        }
+
+        # 按选择器字符串记忆化的locator缓存，每次parse_product开始时清空
+        self._loc_cache: Dict[str, Any] = {}
+
+        # 预构建的locator缓存 - 避免每次调用时重新解析选择器字符串
+        self._delivery_loc = page.locator("span[data-csa-c-delivery-type='delivery']")
+        self._fallback_price_locs = [
+            page.locator(s) for s in (
+                "span.a-price.a-text-price.a-size-medium span.a-offscreen",
+                "span.a-price span.a-offscreen",
+                "span[data-a-color='price'] span.a-offscreen",
+                "div.a-price span.a-offscreen",
+            )
+        ]
+
     def parse_product(self) -> ProductData:
         """
         解析产品信息的主入口
@@ -55,7 +437,8 @@ class AmazonProductParser:
         这是唯一的public方法 - 简单明了
         """
         print("🔍 开始解析亚马逊产品信息...")
-        
+        self._loc_cache.clear()
+
         try:
             # 确保页面完全加载
             self._prepare_page()
@@ -90,25 +473,19 @@ class AmazonProductParser:
         print("开始解析产品尺寸信息")
         dimensions_str = self.product_data.details.get("product dimensions")
         print(f"product dimensions: {dimensions_str}")
+        if not dimensions_str: ##item dimensions d x w x h:15"D x 22.83"W x 24"H
+            dimensions_str = self.product_data.details.get("item dimensions d x w x h")
+            print(f"item dimensions d x w x h :{dimensions_str}")
         if dimensions_str: # product dimensions: 15"D x 22.83"W x 24"H
             depth_cm, width_cm, height_cm = self._parse_dimensions(dimensions_str)
+            pending = {}
             if depth_cm:
-                self.product_data.add_detail("depth_cm", str(depth_cm))
+                pending["depth_cm"] = str(depth_cm)
             if width_cm:
-                self.product_data.add_detail("width_cm", str(width_cm))
+                pending["width_cm"] = str(width_cm)
             if height_cm:
-                self.product_data.add_detail("height_cm", str(height_cm))
-        else: ##item dimensions d x w x h:15"D x 22.83"W x 24"H  
-            dimensions_str = self.product_data.details.get("item dimensions d x w x h")
-            print(f"item dimensions d x w x h :{dimensions_str}")
-            if dimensions_str:
-                depth_cm, width_cm, height_cm = self._parse_dimensions(dimensions_str)
-                if depth_cm:
-                    self.product_data.add_detail("depth_cm", str(depth_cm))
-                if width_cm:
-                    self.product_data.add_detail("width_cm", str(width_cm))
-                if height_cm:
-                    self.product_data.add_detail("height_cm", str(height_cm))
+                pending["height_cm"] = str(height_cm)
+            self.product_data.add_details(pending)
     
     def _parse_dimensions(self, dimensions_str: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
         """
@@ -121,112 +498,98 @@ class AmazonProductParser:
             tuple: (depth_cm, width_cm, height_cm) 或 (None, None, None)
         """
         try:
-            import re
-            
             # 清理字符串，移除多余空格
             dimensions_str = dimensions_str.strip()
-            print(f"🔍 解析尺寸字符串: {dimensions_str}")
-            
-            # 初始化结果
-            depth_cm = None
-            width_cm = None
-            height_cm = None
+            logger.debug("🔍 解析尺寸字符串: %s", dimensions_str)
             
+            # 初始化结果 - 下标对应 (depth, width, height)
+            results: list = [None, None, None]
+
             # 正则表达式匹配模式：数字 + 可选小数 + 英寸符号 + 维度标识
             # 匹配如: 15"D, 22.83"W, 24"H
             dimension_pattern = r'([0-9]*\.?[0-9]+)"([DWHL])'
-            matches = re.findall(dimension_pattern, dimensions_str, re.IGNORECASE)
-            
-            if not matches:
-                # 尝试其他可能的格式
-                # 格式如: "15 x 22.83 x 24 inches" 或 "D15 x W22.83 x H24"
-                number_pattern = r'([0-9]*\.?[0-9]+)'
-                numbers = re.findall(number_pattern, dimensions_str)
-                
-                if len(numbers) >= 3:
-                    # 假设顺序为 D x W x H
-                    try:
-                        depth_cm = self._inches_to_cm(float(numbers[0]))
-                        width_cm = self._inches_to_cm(float(numbers[1]))
-                        height_cm = self._inches_to_cm(float(numbers[2]))
-                        print(f"  ✅ 按顺序解析: D={depth_cm}cm, W={width_cm}cm, H={height_cm}cm")
-                        return depth_cm, width_cm, height_cm
-                    except (ValueError, IndexError):
-                        pass
-                        
-                print(f"  ⚠️ 无法解析尺寸格式: {dimensions_str}")
-                return None, None, None
-            
-            # 解析匹配到的尺寸
-            for value_str, dimension_type in matches:
+
+            # 解析匹配到的尺寸 - finditer按需匹配，三个维度齐全即提前结束
+            matched_any = False
+            for match in re.finditer(dimension_pattern, dimensions_str, re.IGNORECASE):
+                matched_any = True
+                value_str, dimension_type = match.groups()
                 try:
                     value_inches = float(value_str)
-                    value_cm = self._inches_to_cm(value_inches)
-                    
-                    if dimension_type.upper() == 'D' or dimension_type.upper() == 'L':
-                        depth_cm = value_cm
-                        print(f"  📏 深度: {value_inches}\" = {value_cm}cm")
-                    elif dimension_type.upper() == 'W':
-                        width_cm = value_cm
-                        print(f"  📏 宽度: {value_inches}\" = {value_cm}cm")
-                    elif dimension_type.upper() == 'H':
-                        height_cm = value_cm
-                        print(f"  📏 高度: {value_inches}\" = {value_cm}cm")
-                        
+                    value_cm = round(value_inches * 2.54, 2)
                 except ValueError as e:
-                    print(f"  ❌ 解析数值失败: {value_str} - {e}")
+                    logger.debug("  ❌ 解析数值失败: %s - %s", value_str, e)
                     continue
-            
-            return depth_cm, width_cm, height_cm
+
+                # 表查找替代三路if/elif分支判断
+                idx = _DIM_TABLE.get(dimension_type.upper())
+                if idx is not None:
+                    results[idx] = value_cm
+                    logger.debug("  📏 %s: %s\" = %scm", _DIM_LABELS[idx], value_inches, value_cm)
+
+                if None not in results:
+                    break
+
+            if matched_any:
+                depth_cm, width_cm, height_cm = results
+                return depth_cm, width_cm, height_cm
+
+            # 尝试其他可能的格式
+            # 格式如: "15 x 22.83 x 24 inches" 或 "D15 x W22.83 x H24"
+            # 只取前三个数字，避免为带单位后缀的长字符串构建完整匹配列表
+            numbers = [m.group(1) for m in islice(_NUM_RE.finditer(dimensions_str), 3)]
+
+            if len(numbers) == 3:
+                # 假设顺序为 D x W x H，直接内联换算（1英寸 = 2.54厘米）
+                try:
+                    depth_cm, width_cm, height_cm = (
+                        round(float(numbers[0]) * 2.54, 2),
+                        round(float(numbers[1]) * 2.54, 2),
+                        round(float(numbers[2]) * 2.54, 2),
+                    )
+                    logger.debug("  ✅ 按顺序解析: D=%scm, W=%scm, H=%scm", depth_cm, width_cm, height_cm)
+                    return depth_cm, width_cm, height_cm
+                except (ValueError, IndexError):
+                    pass
+
+            logger.debug("  ⚠️ 无法解析尺寸格式: %s", dimensions_str)
+            return None, None, None
             
         except Exception as e:
-            print(f"❌ 尺寸解析失败: {e}")
+            logger.debug("❌ 尺寸解析失败: %s", e)
             return None, None, None
     
-    def _inches_to_cm(self, inches: float) -> float:
-        """
-        将英寸转换为厘米
-        
-        Args:
-            inches: 英寸值
-            
-        Returns:
-            float: 厘米值（保留2位小数）
-        """
-        # 1英寸 = 2.54厘米
-        cm = inches * 2.54
-        return round(cm, 2)
     def _prepare_page(self) -> None:
         """准备页面 - 滚动确保内容加载"""
         try:
-            print("🔍 开始Amazon产品页面解析...")
+            logger.debug("🔍 开始Amazon产品页面解析...")
             # 持续监测并点击反爬虫拦截按钮，直到按钮消失
+            # JS侧谓词判断按钮是否存在，常规页面一次等待即通过，无Python侧轮询
+            continue_button_js = '!document.querySelector("button.a-button-text[alt=\'Continue shopping\']")'
             while True:
-                continue_button = self.page.locator("button.a-button-text[alt='Continue shopping']")
-                if continue_button.count() > 0 and continue_button.is_visible():
-                    print("⚠️ 检测到反爬虫拦截，尝试点击Continue按钮...")
+                try:
+                    self.page.wait_for_function(continue_button_js, timeout=1000)
+                    logger.debug("✅ 反爬虫拦截按钮已消失，继续解析流程")
+                    break
+                except Exception:
+                    logger.debug("⚠️ 检测到反爬虫拦截，尝试点击Continue按钮...")
                     try:
-                        self.page.wait_for_timeout(2000)
-                        # 点击Continue按钮
-                        continue_button.click()
+                        self.page.evaluate(
+                            'document.querySelector("button.a-button-text[alt=\'Continue shopping\']")?.click()'
+                        )
                         # 等待页面重新加载
                         self.page.wait_for_load_state("domcontentloaded")
-                        print("✅ 点击Continue按钮成功，页面已重新加载")
-                        # 等待一段时间以确保页面稳定
-                        self.page.wait_for_timeout(1000)
+                        logger.debug("✅ 点击Continue按钮成功，页面已重新加载")
                     except Exception as e:
-                        print(f"⚠️ 点击Continue按钮失败: {e}")
-                else:
-                    print("✅ 反爬虫拦截按钮已消失，继续解析流程")
-                    break
-            print("检查配送地址是否为纽约10001")
+                        logger.debug("⚠️ 点击Continue按钮失败: %s", e)
+            logger.debug("检查配送地址是否为纽约10001")
             deliver_to = self.page.locator("#glow-ingress-line2").inner_text()
-            print(f"deliver_to: {deliver_to}")
-            if not deliver_to.__contains__("10001"):
-                print("配送地点不是纽约10001，准备切换")
+            logger.debug("deliver_to: %s", deliver_to)
+            if "10001" not in deliver_to:
+                logger.debug("配送地点不是纽约10001，准备切换")
                 language_button = self.page.locator("#nav-global-location-popover-link")
                 language_button.wait_for(timeout=2000)
-                print("切换语言和地区设置")
+                logger.debug("切换语言和地区设置")
                 language_button.click()
             
                 # Wait for the location dialog to appear
@@ -235,18 +598,18 @@ class AmazonProductParser:
                 # Fill the zip code
                 zip_input = self.page.locator("#GLUXZipUpdateInput")
                 zip_input.fill("10001")
-                print("已填写邮政编码: 10001")
+                logger.debug("已填写邮政编码: 10001")
                 
                 # Click the Apply button
                 apply_button = self.page.locator("#GLUXZipUpdate")
                 apply_button.click()
-                print("已点击应用按钮")
+                logger.debug("已点击应用按钮")
                 input("切换成功后回车键继续...")
         
             self.page.wait_for_load_state("domcontentloaded")
       
             # 滚动到页面底部，然后回到顶部，确保所有内容加载
-            print("滚动页面到底部显示所有元素...")
+            logger.debug("滚动页面到底部显示所有元素...")
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             self.page.wait_for_timeout(2000)
             self.page.wait_for_load_state("load")
@@ -259,11 +622,19 @@ class AmazonProductParser:
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.5)")
             self.page.wait_for_timeout(1000)
             
-            print("页面滚动完成，准备开始解析...")
+            logger.debug("页面滚动完成，准备开始解析...")
            
         except Exception as e:
-            print(f"⚠️ 页面准备过程中出现警告: {e}")
+            logger.debug("⚠️ 页面准备过程中出现警告: %s", e)
     
+    def _L(self, selector: str):
+        """按选择器字符串记忆化locator，重复查询不再重新解析选择器"""
+        cached = self._loc_cache.get(selector)
+        if cached is None:
+            cached = self.page.locator(selector)
+            self._loc_cache[selector] = cached
+        return cached
+
     def _parse_title(self) -> None:
         """解析产品标题"""
         try:
@@ -271,19 +642,21 @@ class AmazonProductParser:
             self.product_data.asin = self.page.url.split('/dp/')[1].split('?')[0].replace('/','')
             self.product_data.title = title_element.inner_text()
             print(f"📝 产品标题: {self.product_data.title[:50]}...")
-            self.product_data.add_detail('Title', self.product_data.title)
-            self.product_data.add_detail('ASIN', self.product_data.asin)
+            self.product_data.add_details({
+                'Title': self.product_data.title,
+                'ASIN': self.product_data.asin,
+            })
         except Exception as e:
             self._add_error(f"标题解析失败: {e}")
     
     def _parse_price(self) -> None:
         """解析产品价格 - 支持普通页面、弹框模式和Prime Member价格模式"""
         try:
-            # 首先尝试从隐藏字段获取非会员价格
-            # base_price_success = self._parse_price_from_hidden_fields()
-            # if base_price_success:
-            #     return
-            
+            # 首先尝试从隐藏字段获取非会员价格，成功则只需补上运费
+            if self._parse_price_from_hidden_fields():
+                self._parse_delivery()
+                return
+
             # 检查是否存在需要弹框获取价格信息的情况
             buybox_choices = self.page.locator("span#buybox-see-all-buying-choices")
             
@@ -326,8 +699,10 @@ class AmazonProductParser:
                             print(f"💱 货币符号: {currency_symbol}")
                         
                         # 添加到产品详情
-                        self.product_data.add_detail('Price', f"{self.product_data.price}")
-                        self.product_data.add_detail('Price Source', 'Base Product Price (Non-Member)')
+                        self.product_data.add_details({
+                            'Price': f"{self.product_data.price}",
+                            'Price Source': 'Base Product Price (Non-Member)',
+                        })
                         return True
                     except ValueError as e:
                         print(f"⚠️ 基础价格值转换失败: {price_value} - {e}")
@@ -351,54 +726,49 @@ class AmazonProductParser:
             bool: 是否成功解析价格
         """
         try:
-            print("🔍 尝试从Regular Price手风琴面板获取非会员价格...")
+            logger.debug("🔍 尝试从Regular Price手风琴面板获取非会员价格...")
             
-            # 查找包含"Regular Price"的手风琴面板
+            # 查找包含"Regular Price"的手风琴面板 - all()一次取回所有面板
             regular_price_panels = self.page.locator("div[data-a-accordion-row-name='newAccordionRow']")
-            panel_count = regular_price_panels.count()
-            
-            for i in range(panel_count):
+
+            for i, panel in enumerate(regular_price_panels.all()):
                 try:
-                    panel = regular_price_panels.nth(i)
-                    
                     # 检查面板标题是否包含"Regular Price"
                     caption_element = panel.locator(".accordion-caption, [id*='Caption']")
                     if caption_element.count() > 0:
                         caption_text = caption_element.inner_text().strip()
                         if "Regular Price" in caption_text:
-                            print(f"📋 找到Regular Price面板: {caption_text}")
-                            
-                            # 从该面板中获取价格
-                            price_elements = panel.locator("span.a-offscreen")
-                            price_count = price_elements.count()
-                            
-                            for j in range(price_count):
-                                try:
-                                    price_text = price_elements.nth(j).inner_text().strip()
-                                    if '$' in price_text and len(price_text) < 20:
-                                        clean_price = price_text.replace('$', '').strip()
-                                        if clean_price and clean_price.replace('.', '').replace(',', '').isdigit():
-                                            self.product_data.price = float(clean_price.replace(',', ''))
-                                            print(f"💰 从Regular Price面板获取价格: ${self.product_data.price:.2f}")
-                                            
-                                            # 设置默认运费
-                                            # self.product_data.delivery_price = 0
-                                            
-                                            # 添加到产品详情
-                                            self.product_data.add_detail('Price', f"{self.product_data.price}")
-                                            self.product_data.add_detail('Price Source', 'Regular Price (Non-Member)')
-                                            
-                                            return True
-                                except Exception:
-                                    continue
+                            logger.debug("📋 找到Regular Price面板: %s", caption_text)
+
+                            # 从该面板中获取价格 - 一次往返取回所有文本
+                            price_texts = panel.locator("span.a-offscreen").all_inner_texts()
+
+                            for price_text in price_texts:
+                                price_text = price_text.strip()
+                                if '$' in price_text and len(price_text) < 20:
+                                    price_value = _try_price(price_text)
+                                    if price_value is not None:
+                                        self.product_data.price = price_value
+                                        logger.debug("💰 从Regular Price面板获取价格: $%.2f", self.product_data.price)
+
+                                        # 设置默认运费
+                                        # self.product_data.delivery_price = 0
+
+                                        # 添加到产品详情
+                                        self.product_data.add_details({
+                                            'Price': f"{self.product_data.price}",
+                                            'Price Source': 'Regular Price (Non-Member)',
+                                        })
+
+                                        return True
                 except Exception as e:
-                    print(f"  面板 {i+1} 处理失败: {e}")
+                    logger.debug("  面板 %s 处理失败: %s", i+1, e)
                     continue
             
             return False
             
         except Exception as e:
-            print(f"⚠️ 从Regular Price面板解析价格失败: {e}")
+            logger.debug("⚠️ 从Regular Price面板解析价格失败: %s", e)
             return False
 
     def _parse_price_from_modal(self) -> bool:
@@ -408,31 +778,29 @@ class AmazonProductParser:
             buybox_button = self.page.locator("span#buybox-see-all-buying-choices")
             if buybox_button.count() > 0:
                 buybox_button.click()
-                print("✅ 点击了buybox按钮，等待弹框加载...")
+                logger.debug("✅ 点击了buybox按钮，等待弹框加载...")
                 
                 # 等待弹框内容加载
                 self.page.wait_for_timeout(2000)
                 
                 # 方法1: 尝试从弹框中的 aok-offscreen 获取价格
-                modal_price_elements = self.page.locator("span.aok-offscreen")
-                modal_price_count = modal_price_elements.count()
-                
+                # DOM侧过滤只回传短的含$文本，避免逐元素IPC往返
+                modal_price_texts = self.page.evaluate(
+                    "() => [...document.querySelectorAll('span.aok-offscreen')]"
+                    ".map(e => e.innerText).filter(t => t.length < 20 && t.includes('$'))"
+                )
+
                 price_found = False
-                for i in range(modal_price_count):
-                    try:
-                        price_text = modal_price_elements.nth(i).inner_text().strip()
-                        if '$' in price_text and len(price_text) < 20:  # 价格文本通常较短
-                            clean_price = price_text.replace('$', '').strip()
-                            if clean_price and clean_price.replace('.', '').replace(',', '').isdigit():
-                                self.product_data.price = float(clean_price.replace(',', ''))
-                                print(f"💰 从弹框获取产品价格: ${self.product_data.price:.2f}")
-                                price_found = True
-                                break
-                    except Exception as inner_e:
-                        continue
+                for price_text in modal_price_texts:
+                    price_value = _try_price(price_text)
+                    if price_value is not None:
+                        self.product_data.price = price_value
+                        logger.debug("💰 从弹框获取产品价格: $%.2f", self.product_data.price)
+                        price_found = True
+                        break
                 
                 if not price_found:
-                    print("⚠️ 未能从aok-offscreen获取价格，尝试其他选择器...")
+                    logger.debug("⚠️ 未能从aok-offscreen获取价格，尝试其他选择器...")
                     # 方法2: 尝试其他价格选择器
                     alt_price_selectors = [
                         "span.a-price-whole",
@@ -454,7 +822,7 @@ class AmazonProductParser:
                                     full_price = whole_price
                                 
                                 self.product_data.price = float(full_price.replace(',', ''))
-                                print(f"💰 从弹框备用方法获取产品价格: ${self.product_data.price:.2f}")
+                                logger.debug("💰 从弹框备用方法获取产品价格: $%.2f", self.product_data.price)
                                 price_found = True
                                 break
                         except Exception:
@@ -468,9 +836,9 @@ class AmazonProductParser:
                         self.product_data.delivery_price = 0
                         if delivery_price_str and delivery_price_str != 'FREE':
                             self.product_data.delivery_price = float(delivery_price_str.replace('$', ''))
-                        print(f"🚚 从弹框获取运费价格: ${self.product_data.delivery_price:.2f}")
+                        logger.debug("🚚 从弹框获取运费价格: $%.2f", self.product_data.delivery_price)
                 except Exception as delivery_e:
-                    print(f"⚠️ 弹框运费解析失败: {delivery_e}")
+                    logger.debug("⚠️ 弹框运费解析失败: %s", delivery_e)
                     self.product_data.delivery_price = 0
                 
                 # 关闭弹框（如果有关闭按钮）
@@ -478,42 +846,48 @@ class AmazonProductParser:
                     close_button = self.page.locator("button[aria-label*='Close'], button.a-button-close, [data-action*='close']")
                     if close_button.count() > 0:
                         close_button.first.click()
-                        print("✅ 关闭了价格弹框")
+                        logger.debug("✅ 关闭了价格弹框")
                 except Exception:
                     # 按Escape键关闭弹框
                     self.page.keyboard.press('Escape')
                 
                 if price_found:
-                    self.product_data.add_detail('Price', f"{self.product_data.price}")
-                    self.product_data.add_detail('Delivery Price', f"{self.product_data.delivery_price}")
+                    self.product_data.add_details({
+                        'Price': f"{self.product_data.price}",
+                        'Delivery Price': f"{self.product_data.delivery_price}",
+                    })
                     return True
                 
             return False
             
         except Exception as e:
-            print(f"⚠️ 弹框价格解析失败: {e}")
+            logger.debug("⚠️ 弹框价格解析失败: %s", e)
             return False
     
+    def _parse_delivery(self) -> None:
+        """解析运费价格"""
+        delivery_price_str = self._delivery_loc.last.get_attribute('data-csa-c-delivery-price')
+        self.product_data.delivery_price = 0
+        if delivery_price_str=='fastest':
+            delivery_price_str = self._delivery_loc.first.get_attribute('data-csa-c-delivery-price')
+        if delivery_price_str != 'FREE':
+            self.product_data.delivery_price = float((delivery_price_str or '0').replace('$', ''))
+        print(f"🚚 运费价格: ${self.product_data.delivery_price:.2f}")
+        self.product_data.add_detail('Delivery Price', f"{self.product_data.delivery_price}")
+
     def _parse_price_standard(self) -> None:
         """标准价格解析方法 - 优先选择非会员价格"""
         try:
-            # 尝试隐藏字段域获取价格
-            self._parse_price_from_hidden_fields()   
             # 解析运费
-            delivery_price_str = self.page.locator("span[data-csa-c-delivery-type='delivery']").last.get_attribute('data-csa-c-delivery-price')
-            self.product_data.delivery_price = 0
-            if delivery_price_str=='fastest':
-                delivery_price_str = self.page.locator("span[data-csa-c-delivery-type='delivery']").first.get_attribute('data-csa-c-delivery-price')
-            if delivery_price_str != 'FREE':
-                self.product_data.delivery_price = float((delivery_price_str or '0').replace('$', ''))
+            self._parse_delivery()
             if self.product_data.price==0:
                 self._parse_price_fallback()
             print(f"💰 产品价格: ${self.product_data.price:.2f}")
-            print(f"🚚 运费价格: ${self.product_data.delivery_price:.2f}")
-            self.product_data.add_detail('Price', f"{self.product_data.price}")
-            self.product_data.add_detail('Delivery Price', f"{self.product_data.delivery_price}")
-            self.product_data.add_detail('Price Source', 'Standard Core Price')
-            
+            self.product_data.add_details({
+                'Price': f"{self.product_data.price}",
+                'Price Source': 'Standard Core Price',
+            })
+
         except Exception as e:
             print(f"⚠️ 标准价格解析失败: {e}")
             # 尝试备用价格选择器
@@ -531,26 +905,22 @@ class AmazonProductParser:
             
             # 查找包含"Regular Price"标题的元素
             regular_price_headers = self.page.locator("*:has-text('Regular Price')")
-            header_count = regular_price_headers.count()
-            
-            for i in range(header_count):
+
+            for header in regular_price_headers.all():
                 try:
-                    header = regular_price_headers.nth(i)
-                    # 查找该标题附近的价格元素
+                    # 查找该标题附近的价格元素 - all()批量取回，避免逐个nth(i)往返
                     nearby_prices = header.locator("..").locator("span.a-offscreen, span.a-price-whole")
-                    
-                    price_count = nearby_prices.count()
-                    for j in range(price_count):
+
+                    for price_element in nearby_prices.all():
                         try:
-                            price_element = nearby_prices.nth(j)
                             element_class = price_element.get_attribute('class')
                             if element_class == 'a-offscreen':
                                 # 从 a-offscreen 获取完整价格
                                 price_text = price_element.inner_text().strip()
                                 if '$' in price_text:
-                                    clean_price = price_text.replace('$', '').strip()
-                                    if clean_price and clean_price.replace('.', '').replace(',', '').isdigit():
-                                        self.product_data.price = float(clean_price.replace(',', ''))
+                                    price_value = _try_price(price_text)
+                                    if price_value is not None:
+                                        self.product_data.price = price_value
                                         print(f"💰 从 Regular Price 区域获取价格: ${self.product_data.price:.2f}")
                                 
                                         
@@ -570,8 +940,9 @@ class AmazonProductParser:
                                 else:
                                     full_price = whole_price
                                 
-                                if full_price.replace('.', '').replace(',', '').isdigit():
-                                    self.product_data.price = float(full_price.replace(',', ''))
+                                full_price_value = _try_price(full_price)
+                                if full_price_value is not None:
+                                    self.product_data.price = full_price_value
                                     print(f"💰 从 Regular Price 区域获取价格: ${self.product_data.price:.2f}")
                                     
                                     # 设置默认运费
@@ -596,16 +967,9 @@ class AmazonProductParser:
     
     def _parse_price_fallback(self) -> None:
         """备用价格解析方法"""
-        fallback_selectors = [
-            "span.a-price.a-text-price.a-size-medium span.a-offscreen",
-            "span.a-price span.a-offscreen",
-            "span[data-a-color='price'] span.a-offscreen",
-            "div.a-price span.a-offscreen"
-        ]
-        
-        for selector in fallback_selectors:
+        for price_loc in self._fallback_price_locs:
             try:
-                price_element = self.page.locator(selector).first
+                price_element = price_loc.first
                 if price_element.count() > 0:
                     price_str = price_element.inner_text()
                     self.product_data.price = float(price_str.replace('$', ''))
@@ -654,77 +1018,33 @@ class AmazonProductParser:
     def _get_selected_color(self) -> Optional[object]:
         """获取当前选中的颜色"""
         try:
-            # 多种选择器策略获取选中的颜色
-            selectors = [
-                # 策略1: 从展开的维度文本中获取
-                "#inline-twister-expanded-dimension-text-color_name",
-                # 策略2: 从颜色标题区域获取
-                ".inline-twister-dim-title-value",
-                # 策略3: 从选中的按钮获取
-                ".a-button-selected img[alt*='pack']",
-                # 策略4: 更通用的选中颜色选择器
-                "[id*='color_name'][class*='selected'] img"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = self.page.locator(selector).first
-                    if element.count() > 0:
-                        if 'img' in selector:
-                            # 从图片的alt属性获取颜色
-                            alt_text = element.get_attribute('alt')
-                            color_text = alt_text
-                        else:
-                            # 从文本内容获取颜色
-                            color_text = element.inner_text().strip()
-                        
-                        if color_text:
-                            return color_text
-                            # # 清理和标准化颜色文本
-                            # cleaned_color = self._clean_color_text(color_text)
-                            # if cleaned_color:
-                            #     print(f"  ✅ 使用选择器 {selector[:30]}... 获取到颜色: {cleaned_color}")
-                            #     return cleaned_color
-                except Exception as e:
-                    print(f"  选择器 {selector[:30]}... 失败: {e}")
-                    continue
-            
+            # 浏览器内按策略优先级级联尝试，一次往返拿到首个非空结果
+            color_text = self.page.evaluate(
+                _SELECTED_COLOR_CASCADE_JS, _SELECTED_COLOR_SELECTORS
+            )
+            if color_text:
+                return color_text
+
             return None
-            
+
         except Exception as e:
             print(f"获取选中颜色失败: {e}")
             return None
     
     def _get_available_colors(self) -> List[str]:
         """获取所有可用的颜色选项"""
-        colors = []
         try:
-            # 查找所有颜色选项的图片元素
-            color_images = self.page.locator("#inline-twister-row-color_name li img.swatch-image")
-            count = color_images.count()
-            
-            print(f"  🎨 找到 {count} 个颜色选项")
-            
-            for i in range(count):
-                try:
-                    img = color_images.nth(i)
-                    alt_text = img.get_attribute('alt')
-                    
-                    if alt_text:
-                        colors.append(alt_text)
-                        # cleaned_color = self._clean_color_text(alt_text)
-                        # if cleaned_color and cleaned_color not in colors:
-                        #     colors.append(cleaned_color)
-                        #     print(f"    ✅ 颜色选项 {i+1}: {cleaned_color}")
-                            
-                except Exception as e:
-                    print(f"    ❌ 颜色选项 {i+1} 处理失败: {e}")
-                    continue
-            
+            # 查找所有颜色选项的图片元素 - evaluate_all一次取回全部alt属性
+            colors = self._L("#inline-twister-row-color_name li img.swatch-image").evaluate_all(
+                "els => els.map(e => e.getAttribute('alt')).filter(Boolean)"
+            )
+
+            logger.debug("  🎨 找到 %s 个颜色选项", len(colors))
+
             return colors
             
         except Exception as e:
-            print(f"获取可用颜色失败: {e}")
+            logger.debug("获取可用颜色失败: %s", e)
             return []
     
     def _clean_color_text(self, color_text: str) -> Optional[str]:
@@ -734,19 +1054,15 @@ class AmazonProductParser:
         
         # 移除常见的前缀和后缀
         cleaned = color_text.strip()
-        
+
         # 移除包装数量信息（如 "1-pack", "2-pack"）
-        import re
-        cleaned = re.sub(r'^\d+-pack\s+', '', cleaned, flags=re.IGNORECASE)
-        
-        # 移除其他常见前缀
-        prefixes_to_remove = ['color:', 'colour:', 'selected color is']
-        for prefix in prefixes_to_remove:
-            if cleaned.lower().startswith(prefix):
-                cleaned = cleaned[len(prefix):].strip()
-        
+        cleaned = _PACK_PREFIX_RE.sub('', cleaned)
+
+        # 移除其他常见前缀（如 "Color:", "Selected color is"）
+        cleaned = _COLOR_PREFIX_RE.sub('', cleaned, count=1)
+
         # 移除末尾的标点符号
-        cleaned = re.sub(r'[.。]+$', '', cleaned)
+        cleaned = _TRAILING_PUNCT_RE.sub('', cleaned)
         
         # 如果清理后为空或太短，返回None
         if len(cleaned.strip()) < 2:
@@ -809,36 +1125,19 @@ class AmazonProductParser:
     def _get_selected_package_quantity(self) -> Optional[str]:
         """获取当前选中的包装数量"""
         try:
-            # 多种选择器策略获取选中的包装数量
-            selectors = [
-                # 策略1: 从展开的维度文本中获取
-                "#inline-twister-expanded-dimension-text-item_package_quantity",
-                # 策略2: 从包装数量标题区域获取
-                "#inline-twister-dim-title-item_package_quantity .inline-twister-dim-title-value",
-                # 策略3: 从选中的按钮获取
-                ".a-button-selected .swatch-title-text-display",
-                # 策略4: 更通用的选中数量选择器
-                "[id*='item_package_quantity'][class*='selected'] .swatch-title-text"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = self.page.locator(selector).first
-                    if element.count() > 0:
-                        quantity_text = element.inner_text().strip()
-                        
-                        if quantity_text:
-                            # 清理和标准化数量文本
-                            cleaned_quantity = self._clean_quantity_text(quantity_text)
-                            if cleaned_quantity:
-                                print(f"  ✅ 使用选择器 {selector[:40]}... 获取到数量: {cleaned_quantity}")
-                                return cleaned_quantity
-                except Exception as e:
-                    print(f"  选择器 {selector[:40]}... 失败: {e}")
-                    continue
-            
+            # 浏览器内按策略优先级级联收集候选文本，一次往返
+            quantity_texts = self.page.evaluate(
+                _SELECTED_QUANTITY_CASCADE_JS, _SELECTED_QUANTITY_SELECTORS
+            )
+            for quantity_text in quantity_texts:
+                # 清理和标准化数量文本
+                cleaned_quantity = self._clean_quantity_text(quantity_text)
+                if cleaned_quantity:
+                    print(f"  ✅ 获取到数量: {cleaned_quantity}")
+                    return cleaned_quantity
+
             return None
-            
+
         except Exception as e:
             print(f"获取选中包装数量失败: {e}")
             return None
@@ -847,31 +1146,26 @@ class AmazonProductParser:
         """获取所有可用的包装数量选项"""
         quantities = []
         try:
-            # 查找所有包装数量选项的文本元素
-            quantity_elements = self.page.locator("#inline-twister-row-item_package_quantity .swatch-title-text-display")
-            count = quantity_elements.count()
-            
-            print(f"  📦 找到 {count} 个包装数量选项")
-            
-            for i in range(count):
-                try:
-                    element = quantity_elements.nth(i)
-                    quantity_text = element.inner_text().strip()
-                    
-                    if quantity_text:
-                        cleaned_quantity = self._clean_quantity_text(quantity_text)
-                        if cleaned_quantity and cleaned_quantity not in quantities:
-                            quantities.append(cleaned_quantity)
-                            print(f"    ✅ 数量选项 {i+1}: {cleaned_quantity}")
-                            
-                except Exception as e:
-                    print(f"    ❌ 数量选项 {i+1} 处理失败: {e}")
-                    continue
-            
+            # 查找所有包装数量选项的文本元素 - evaluate_all一次取回全部文本
+            quantity_texts = self._L(
+                "#inline-twister-row-item_package_quantity .swatch-title-text-display"
+            ).evaluate_all("els => els.map(e => e.innerText.trim())")
+
+            logger.debug("  📦 找到 %s 个包装数量选项", len(quantity_texts))
+
+            seen = set()  # set去重，避免列表线性查找
+            for i, quantity_text in enumerate(quantity_texts):
+                if quantity_text:
+                    cleaned_quantity = self._clean_quantity_text(quantity_text)
+                    if cleaned_quantity and cleaned_quantity not in seen:
+                        seen.add(cleaned_quantity)
+                        quantities.append(cleaned_quantity)
+                        logger.debug("    ✅ 数量选项 %s: %s", i+1, cleaned_quantity)
+
             return quantities
             
         except Exception as e:
-            print(f"获取可用包装数量失败: {e}")
+            logger.debug("获取可用包装数量失败: %s", e)
             return []
     
     def _clean_quantity_text(self, quantity_text: str) -> Optional[str]:
@@ -882,15 +1176,11 @@ class AmazonProductParser:
         # 移除常见的前缀和后缀
         cleaned = quantity_text.strip()
         
-        # 移除常见前缀
-        import re
-        prefixes_to_remove = ['item package quantity:', 'package quantity:', 'quantity:']
-        for prefix in prefixes_to_remove:
-            if cleaned.lower().startswith(prefix):
-                cleaned = cleaned[len(prefix):].strip()
-        
+        # 移除常见前缀（如 "Item Package Quantity:"）
+        cleaned = _QTY_PREFIX_RE.sub('', cleaned, count=1)
+
         # 提取数字
-        number_match = re.search(r'(\d+)', cleaned)
+        number_match = _DIGIT_RE.search(cleaned)
         if number_match:
             return number_match.group(1)
         
@@ -928,36 +1218,33 @@ class AmazonProductParser:
         specifications_summary = []
         try:
             print("🔍 开始解析产品规格数据...")
-            
-            # 新方法：直接查找所有已选中的规格值
-            expanded_specs = self.page.locator("span[id^='inline-twister-expanded-dimension-text-']")
-            spec_count = expanded_specs.count()
-            
-            if spec_count == 0:
+
+            # 单次evaluate在浏览器内完成整个收割：选中值 + 可用选项一并返回
+            harvested = self._harvest_twister_options()
+
+            if not harvested:
                 print("⚠️ 未找到任何已选中的规格，跳过规格解析")
                 return
-            
-            print(f"📊 找到 {spec_count} 个已选中的规格")
-            
-            # 遍历每个已选中的规格
-            for i in range(spec_count):
+
+            print(f"📊 找到 {len(harvested)} 个已选中的规格")
+
+            # 遍历收割结果（纯Python数据，无逐元素IPC往返）
+            for i, spec_row in enumerate(harvested):
                 try:
-                    spec_element = expanded_specs.nth(i)
-                    spec_id = spec_element.get_attribute('id')
-                    spec_value = spec_element.inner_text().strip()
-                    
-                    if not spec_id or not spec_value:
+                    dimension_name = spec_row['dimension_name']
+                    spec_value = spec_row['selected_value']
+
+                    if not dimension_name or not spec_value:
                         continue
-                    
-                    # 从ID中提取维度名称 (inline-twister-expanded-dimension-text-style_name -> style_name)
-                    dimension_name = spec_id.replace('inline-twister-expanded-dimension-text-', '')
+
                     display_name = self._format_dimension_name(dimension_name)
-                    
-                    print(f"  🔍 发现规格: {display_name} = {spec_value} (ID: {spec_id})")
-                    
-                    # 获取该规格的所有可用选项
-                    available_options = self._get_specification_options_by_dimension(dimension_name)
-                    
+                    print(f"  🔍 发现规格: {display_name} = {spec_value}")
+
+                    # 批量收割结果缺失选项时回退到逐维度的选择器级联
+                    available_options = spec_row['available_options']
+                    if not available_options:
+                        available_options = self._get_specification_options_by_dimension(dimension_name)
+
                     # 构建规格信息
                     spec_info = {
                         'dimension_name': dimension_name,
@@ -966,11 +1253,11 @@ class AmazonProductParser:
                         'available_options': available_options,
                         'options_count': len(available_options)
                     }
-                    
+
                     specifications_summary.append(spec_info)
                     self._add_specification_to_product_data(spec_info)
                     print(f"    ✅ 成功解析规格: {display_name} = {spec_value}, 共 {len(available_options)} 个选项")
-                    
+
                 except Exception as e:
                     print(f"    ❌ 规格 {i + 1} 解析失败: {e}")
                     continue
@@ -985,6 +1272,19 @@ class AmazonProductParser:
         except Exception as e:
             print(f"⚠️ 规格数据解析失败: {e}")
     
+    def _harvest_twister_options(self) -> List[Dict[str, Any]]:
+        """
+        一次evaluate收割全部twister规格（选中值 + 可用选项）
+
+        Returns:
+            List[Dict[str, Any]]: [{dimension_name, selected_value, available_options}, ...]
+        """
+        try:
+            return self.page.evaluate(_TWISTER_HARVEST_JS) or []
+        except Exception as e:
+            print(f"    ⚠️ 批量收割twister规格失败: {e}")
+            return []
+
     def _get_specification_options_by_dimension(self, dimension_name: str) -> List[str]:
         """
         根据维度名称获取所有可用选项
@@ -1059,232 +1359,93 @@ class AmazonProductParser:
             return None
     
     def _get_selected_specification_value(self, row_element, dimension_name: str) -> Optional[str]:
-        """获取当前选中的规格值"""
+        """获取当前选中的规格值 - 一次evaluate取回全部候选字段，按原策略顺序取值"""
         try:
-            # 策略1: 从展开的维度文本中获取
-            expanded_text_selector = f"#inline-twister-expanded-dimension-text-{dimension_name}"
-            expanded_element = row_element.locator(expanded_text_selector)
-            
-            if expanded_element.count() > 0 and expanded_element.is_visible():
-                selected_text = expanded_element.inner_text().strip()
-                if selected_text:
-                    return selected_text
-            
-            # 策略2: 从选中的按钮获取 (新增radio button支持)
-            selected_button = row_element.locator(".a-button-selected")
-            if selected_button.count() > 0:
-                # 尝试从 alt 属性获取（适用于图片型选项）
-                img_element = selected_button.locator("img")
-                if img_element.count() > 0:
-                    alt_text = img_element.get_attribute('alt')
-                    if alt_text:
-                        return alt_text
-                
-                # 尝试从文本内容获取
-                button_text = selected_button.inner_text().strip()
-                if button_text and len(button_text) < 100:  # 过滤过长的文本
-                    return button_text
-            
-            # 策略3: 新增 - 从选中的radio button获取 (Pattern Name等格式)
-            selected_radio = row_element.locator("input[role='radio'][aria-checked='true']")
-            if selected_radio.count() > 0:
-                # 获取对应的按钮容器
-                radio_button = selected_radio.locator("..").locator("..")
-                if radio_button.count() > 0:
-                    # 尝试从图片alt属性获取
-                    img_element = radio_button.locator("img")
-                    if img_element.count() > 0:
-                        alt_text = img_element.get_attribute('alt')
-                        if alt_text:
-                            print(f"      🎯 从radio button获取选中值: {alt_text}")
-                            return alt_text
-                    
-                    # 尝试从文本内容获取
-                    button_text = radio_button.inner_text().strip()
-                    # 只取第一行简短文本，避免包含价格信息
-                    lines = button_text.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if line and not '$' in line and len(line) < 50:
-                            print(f"      🎯 从radio button文本获取选中值: {line}")
-                            return line
-            
+            probe = row_element.evaluate(_SELECTED_SPEC_PROBE_JS, dimension_name)
+
+            # 策略1: 展开的维度文本
+            if probe['selectedText']:
+                return probe['selectedText']
+
+            # 策略2: 选中按钮的img alt，其次按钮文本
+            if probe['buttonAlt']:
+                return probe['buttonAlt']
+            if probe['buttonText'] and len(probe['buttonText']) < 100:  # 过滤过长的文本
+                return probe['buttonText']
+
+            # 策略3: 选中radio button的img alt，其次首个不含价格的短文本行
+            if probe['radioAlt']:
+                logger.debug("      🎯 从radio button获取选中值: %s", probe['radioAlt'])
+                return probe['radioAlt']
+            match = _FIRST_SHORT_NONPRICE_RE.search(probe['radioText'])
+            if match:
+                logger.debug("      🎯 从radio button文本获取选中值: %s", match.group(1))
+                return match.group(1)
+
             return None
             
         except Exception as e:
-            print(f"      获取选中值失败: {e}")
+            logger.debug("      获取选中值失败: %s", e)
             return None
     
     def _get_available_specification_options(self, row_element, dimension_name: str) -> List[str]:
-        """获取所有可用的规格选项"""
+        """获取所有可用的规格选项 - 整个选择器级联在一次evaluate内完成"""
         options = []
         try:
-            # 查找所有的选项元素
-            option_selectors = [
-                # 策略1: radio button + 图片样式 (Pattern Name等格式)
-                "ul.dimension-values-list li[data-asin]",
-                # 策略2: 图片型选项
-                "ul.dimension-values-list li img.swatch-image",
-                # 策略3: 文本型选项
-                "ul.dimension-values-list li .a-button",
-                # 策略4: 更广泛的选项选择器
-                "ul.dimension-values-list li"
-            ]
-            
-            for selector in option_selectors:
-                try:
-                    option_elements = row_element.locator(selector)
-                    count = option_elements.count()
-                    
-                    if count > 0:
-                        print(f"      使用选择器 '{selector}' 找到 {count} 个选项")
-                        
-                        for i in range(count):
-                            try:
-                                element = option_elements.nth(i)
-                                option_value = None
-                                
-                                # 根据选择器类型提取值
-                                if "li[data-asin]" in selector:
-                                    # 新增: 处理radio button + 图片样式
-                                    img = element.locator("img")
-                                    if img.count() > 0:
-                                        alt_text = img.get_attribute('alt')
-                                        if alt_text:
-                                            option_value = alt_text
-                                            print(f"        🖼️ 从数据元素获取图片选项: {alt_text}")
-                                    
-                                    # 如果没有图片，尝试从按钮文本获取
-                                    if not option_value:
-                                        button = element.locator(".a-button .a-button-text")
-                                        if button.count() > 0:
-                                            button_text = button.inner_text().strip()
-                                            # 只取第一行简短文本
-                                            lines = button_text.split('\n')
-                                            for line in lines:
-                                                line = line.strip()
-                                                if line and not '$' in line and len(line) < 50:
-                                                    option_value = line
-                                                    print(f"        🏷️ 从数据元素获取按钮选项: {line}")
-                                                    break
-                                                    
-                                elif "img.swatch-image" in selector:
-                                    # 支持纯文本显示的规格选项
-                                    alt_text = element.get_attribute('alt')
-                                    if alt_text:
-                                        option_value = alt_text
-                                        # 检查是否是纯文本规格（如 "Single", "2-pack", "3-pack"）
-                                        if self._is_text_only_specification(alt_text):
-                                            print(f"        🔤 检测到文本规格: {alt_text}")
-                                elif ".a-button" in selector:
-                                    # 从按钮内部的img或文本获取
-                                    img = element.locator("img")
-                                    if img.count() > 0:
-                                        alt_text = img.get_attribute('alt')
-                                        if alt_text:
-                                            option_value = alt_text
-                                            # 检查是否是纯文本规格
-                                            if self._is_text_only_specification(alt_text):
-                                                print(f"        🔤 检测到按钮文本规格: {alt_text}")
-                                    else:
-                                        button_text = element.inner_text().strip()
-                                        # 过滤掉价格信息和过长的文本
-                                        lines = button_text.split('\n')
-                                        for line in lines:
-                                            line = line.strip()
-                                            if line and not '$' in line and len(line) < 50:
-                                                option_value = line
-                                                break
-                                else:
-                                    # 通用处理
-                                    data_asin = element.get_attribute('data-asin')
-                                    if data_asin:
-                                        # 尝试从子元素获取值
-                                        img = element.locator("img")
-                                        if img.count() > 0:
-                                            alt_text = img.get_attribute('alt')
-                                            if alt_text:
-                                                option_value = alt_text
-                                                # 检查是否是纯文本规格
-                                                if self._is_text_only_specification(alt_text):
-                                                    print(f"        🔤 检测到通用文本规格: {alt_text}")
-                                
-                                if option_value and option_value not in options:
-                                    options.append(option_value)
-                                    print(f"        ✅ 选项 {len(options)}: {option_value}")
-                                    
-                            except Exception as e:
-                                print(f"        ❌ 选项 {i+1} 处理失败: {e}")
-                                continue
-                        
-                        # 如果找到了选项，停止尝试其他选择器
-                        if options:
-                            break
-                            
-                except Exception as e:
-                    print(f"      选择器 '{selector}' 处理失败: {e}")
-                    continue
-            
+            options = row_element.evaluate(_OPTION_CASCADE_JS) or []
+            if options:
+                logger.debug("      ✅ 级联提取到 %s 个选项: %s", len(options), options)
+
             # 新增：如果没有找到任何选项，尝试从纯文本规格中提取
             if not options:
                 text_only_options = self._extract_text_only_specifications(row_element, dimension_name)
                 if text_only_options:
                     options.extend(text_only_options)
-                    print(f"      🔤 从文本规格中提取到 {len(text_only_options)} 个选项")
-            
+                    logger.debug("      🔤 从文本规格中提取到 %s 个选项", len(text_only_options))
+
             return options
-            
+
         except Exception as e:
-            print(f"      获取可用选项失败: {e}")
+            logger.debug("      获取可用选项失败: %s", e)
             return []
     
-    def _is_text_only_specification(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_text_only_specification(text: str) -> bool:
         """
         判断是否是纯文本规格（不可选择的文本显示）
-        
+
+        常见规格文本（"1-pack"、"Single"等）跨页面高度重复，lru_cache
+        使重复判定退化为一次字典查找。
+
         Args:
             text: 规格文本
-            
+
         Returns:
             bool: 是否为纯文本规格
         """
         if not text:
             return False
-            
-        text_lower = text.lower().strip()
-        
-        # 常见的文本规格模式
-        text_patterns = [
-            # 数量相关
-            r'^\d+-pack$',  # 1-pack, 2-pack, 3-pack
-            r'^\d+\s*pack$',  # 1 pack, 2 pack
-            r'^single$',  # single
-            r'^pack\s*of\s*\d+$',  # pack of 2, pack of 3
-            
-            # 尺寸相关
-            r'^\d+(\.\d+)?\s*(inch|inches|cm|mm|ft|feet)$',  # 12 inch, 5.5 cm
-            r'^\d+(\.\d+)?"$',  # 12", 5.5"
-            r'^\d+x\d+$',  # 12x18
-            
-            # 样式相关
-            r'^(small|medium|large|xl|xxl)$',  # 尺寸
-            r'^(round|square|rectangular|oval)$',  # 形状
-            r'^(set|individual|pair)$',  # 组合方式
-            
-            # 新增: Pattern Name相关的文本规格模式
-            r'^(solid|striped|floral|geometric|abstract)$',  # 图案类型
-            r'^(storage|decorative|functional)$',  # 功能类型
-            r'^[a-z]+\s*(style|pattern|design)$',  # 如 "storage style", "floral pattern"
-            r'^[a-z]+(-[a-z]+)*$',  # 连字符分隔的单词，如 "solid-color", "multi-pattern"
-        ]
-        
-        import re
-        for pattern in text_patterns:
-            if re.match(pattern, text_lower):
+
+        # 一次链式调用得到规范形态，后续判断全部复用同一份字符串
+        text_lower = text.strip().lower()
+
+        # 三级判定：固定字面量走frozenset，数字包装数走字符串方法，
+        # 其余残差模式才落到合并交替正则——常见输入不触碰正则引擎
+        if text_lower in _TEXT_SPEC_LITERALS:
+            return True
+
+        if text_lower.endswith('pack'):
+            head = text_lower[:-4].rstrip()
+            if head.endswith('-'):
+                head = head[:-1]
+            if head.isdigit():  # "3-pack" / "3 pack" / "3pack"
                 return True
-                
-        return False
-    
+        elif text_lower.startswith('pack of ') and text_lower[8:].strip().isdigit():
+            return True
+
+        return bool(_TEXT_SPEC_COMBINED.match(text_lower))
+
     def _extract_text_only_specifications(self, row_element, dimension_name: str) -> List[str]:
         """
         从纯文本规格区域提取选项（当没有可选按钮时）
@@ -1297,128 +1458,92 @@ class AmazonProductParser:
             List[str]: 提取到的文本选项列表
         """
         options = []
+        seen = set()  # set去重，避免列表线性查找
         try:
-            print(f"      🔍 尝试提取文本规格选项: {dimension_name}")
+            logger.debug("      🔍 尝试提取文本规格选项: %s", dimension_name)
             
-            # 策略1: 从展开内容区域的aria-label获取选项数量信息
-            expander_content = row_element.locator(f"#inline-twister-expander-content-{dimension_name}")
-            if expander_content.count() > 0:
-                total_variations = expander_content.get_attribute('data-totalvariationcount')
-                if total_variations:
-                    print(f"        📊 检测到 {total_variations} 个变体选项")
+            # 策略1: 从展开内容区域获取选项数量信息 - 仅供调试输出，
+            # 非调试级别时跳过这两次CDP往返
+            if logger.isEnabledFor(logging.DEBUG):
+                expander_content = row_element.locator(f"#inline-twister-expander-content-{dimension_name}")
+                if expander_content.count() > 0:
+                    total_variations = expander_content.get_attribute('data-totalvariationcount')
+                    if total_variations:
+                        logger.debug("        📊 检测到 %s 个变体选项", total_variations)
             
             # 策略2: 从当前选中的文本获取至少一个选项
+            # is_visible()是额外的布局往返；隐藏span的inner_text()本就返回空串，
+            # 由下面的真值判断兜底即可
             selected_text_element = row_element.locator(f"#inline-twister-expanded-dimension-text-{dimension_name}")
-            if selected_text_element.count() > 0 and selected_text_element.is_visible():
+            if selected_text_element.count() > 0:
                 selected_text = selected_text_element.inner_text().strip()
-                if selected_text and selected_text not in options:
+                if selected_text and selected_text not in seen:
+                    seen.add(selected_text)
                     options.append(selected_text)
-                    print(f"        ✅ 当前选中文本: {selected_text}")
+                    logger.debug("        ✅ 当前选中文本: %s", selected_text)
             
             # 策略3: 新增 - 专门处理radio button + image swatch结构
-            radio_button_selectors = [
-                "li[data-asin] input[role='radio']",  # radio button元素
-                "li.inline-twister-swatch input[role='radio']",  # 带有inline-twister-swatch类的radio
-                "ul[role='radiogroup'] li[data-asin]",  # radiogroup中的li元素
-            ]
-            
-            for selector in radio_button_selectors:
-                try:
-                    radio_elements = row_element.locator(selector)
-                    count = radio_elements.count()
-                    
-                    if count > 0:
-                        print(f"        🎯 使用radio选择器 '{selector}' 找到 {count} 个元素")
-                        
-                        for i in range(count):
-                            try:
-                                radio_element = radio_elements.nth(i)
-                                # 获取对应的li容器
-                                li_container = radio_element.locator("../..")
-                                if li_container.count() > 0:
-                                    # 尝试从li容器中的img获取alt文本
-                                    img_element = li_container.locator("img")
-                                    if img_element.count() > 0:
-                                        alt_text = img_element.get_attribute('alt')
-                                        if alt_text and alt_text.strip() and alt_text not in options:
-                                            cleaned_text = alt_text.strip()
-                                            if len(cleaned_text) > 0 and len(cleaned_text) < 50:
-                                                options.append(cleaned_text)
-                                                print(f"        ✅ Radio选项: {cleaned_text}")
-                                
-                            except Exception as e:
-                                print(f"        ⚠️ 处理radio元素 {i+1} 失败: {e}")
-                                continue
-                        
-                        # 如果通过radio button找到了选项，可以停止尝试其他策略
-                        if len(options) >= 2:
-                            break
-                            
-                except Exception as e:
-                    print(f"        ⚠️ Radio选择器 '{selector}' 处理失败: {e}")
-                    continue
+            # CSS :has() 直接命中含radio的li容器，evaluate_all一次取回全部alt，
+            # 替代逐元素的 "../.." XPath父节点爬升
+            try:
+                radio_alt_texts = row_element.locator(
+                    "li[data-asin]:has(input[role='radio']) img"
+                ).evaluate_all("els => els.map(e => e.getAttribute('alt'))")
+
+                if radio_alt_texts:
+                    logger.debug("        🎯 radio选择器找到 %s 个元素", len(radio_alt_texts))
+
+                for alt_text in radio_alt_texts:
+                    if alt_text and alt_text.strip() and alt_text not in seen:
+                        cleaned_text = alt_text.strip()
+                        if len(cleaned_text) > 0 and len(cleaned_text) < 50:
+                            seen.add(alt_text)
+                            options.append(cleaned_text)
+                            logger.debug("        ✅ Radio选项: %s", cleaned_text)
+
+            except Exception as e:
+                logger.debug("        ⚠️ Radio选项批量提取失败: %s", e)
             
             # 策略4: 尝试从隐藏的选项元素中提取（即使不可点击）
-            hidden_options_selectors = [
-                "li[data-asin] img[alt]",  # 从data-asin的li元素中的img alt获取
-                "li[data-initiallyselected] img[alt]",  # 从初始选中状态的元素获取
-                ".dimension-value-list-item img[alt]",  # 从维度值列表项获取
-            ]
-            
-            for selector in hidden_options_selectors:
-                try:
-                    hidden_elements = row_element.locator(selector)
-                    count = hidden_elements.count()
-                    
-                    if count > 0:
-                        print(f"        🔍 使用隐藏选择器 '{selector}' 找到 {count} 个元素")
-                        
-                        for i in range(count):
-                            try:
-                                element = hidden_elements.nth(i)
-                                alt_text = element.get_attribute('alt')
-                                
-                                if alt_text and alt_text.strip() and alt_text not in options:
-                                    # 验证是否是有效的规格文本
-                                    cleaned_text = alt_text.strip()
-                                    if len(cleaned_text) > 0 and len(cleaned_text) < 50:  # 合理的长度
-                                        options.append(cleaned_text)
-                                        print(f"        ✅ 隐藏选项: {cleaned_text}")
-                                        
-                            except Exception as e:
-                                print(f"        ⚠️ 处理隐藏元素 {i+1} 失败: {e}")
-                                continue
-                        
-                        # 如果找到了选项，可以停止或继续查找更多
-                        if len(options) >= 2:  # 找到足够的选项就停止
-                            break
-                            
-                except Exception as e:
-                    print(f"        ⚠️ 隐藏选择器 '{selector}' 处理失败: {e}")
-                    continue
-            
-            # 策略4: 如果仍然只有一个或没有选项，尝试从ARIA标签获取提示
-            if len(options) <= 1:
-                aria_label_element = row_element.locator(f"#dim-values-aria-label-{dimension_name}")
-                if aria_label_element.count() > 0:
-                    aria_text = aria_label_element.inner_text().strip()
-                    if aria_text:
-                        print(f"        💬 ARIA提示: {aria_text}")
-                        # 可以根据ARIA文本推断选项类型，但这里暂时不实现
+            # 逗号合并三个选择器，querySelectorAll一趟取回并天然去重元素，
+            # 替代逐选择器的独立查询和try/except
+            try:
+                alt_texts = row_element.locator(
+                    "li[data-asin] img[alt], "
+                    "li[data-initiallyselected] img[alt], "
+                    ".dimension-value-list-item img[alt]"
+                ).evaluate_all("els => els.map(e => e.getAttribute('alt'))")
+
+                if alt_texts:
+                    logger.debug("        🔍 隐藏选项合并选择器找到 %s 个元素", len(alt_texts))
+
+                for alt_text in alt_texts:
+                    if alt_text and alt_text.strip() and alt_text not in seen:
+                        # 验证是否是有效的规格文本
+                        cleaned_text = alt_text.strip()
+                        if len(cleaned_text) > 0 and len(cleaned_text) < 50:  # 合理的长度
+                            seen.add(alt_text)
+                            options.append(cleaned_text)
+                            logger.debug("        ✅ 隐藏选项: %s", cleaned_text)
+
+            except Exception as e:
+                logger.debug("        ⚠️ 隐藏选项批量提取失败: %s", e)
             
             if options:
-                print(f"      ✅ 成功提取文本规格选项: {options}")
+                logger.debug("      ✅ 成功提取文本规格选项: %s", options)
             else:
-                print(f"      ⚠️ 未能提取到文本规格选项")
+                logger.debug("      ⚠️ 未能提取到文本规格选项")
                 
             return options
             
         except Exception as e:
-            print(f"      ❌ 提取文本规格选项失败: {e}")
+            logger.debug("      ❌ 提取文本规格选项失败: %s", e)
             return []
     
-    def _format_dimension_name(self, dimension_name: str) -> str:
-        """格式化维度名称为显示名称"""
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _format_dimension_name(dimension_name: str) -> str:
+        """格式化维度名称为显示名称 - 维度名字母表很小，lru_cache命中后为纯字典查找"""
         # 将下划线替换为空格，并进行首字母大写
         formatted = dimension_name.replace('_', ' ').title()
         
@@ -1499,7 +1624,7 @@ class AmazonProductParser:
         if 'Item Weight' in self.product_data.details:
             try:
                 weight_str = self.product_data.details['Item Weight']
-                weight_match = re.search(r'([0-9.]+)', weight_str)
+                weight_match = _WEIGHT_NUM_RE.search(weight_str)
                 if weight_match:
                     weight_value = weight_match.group(1)
                     print(f"✅ 从产品详情获取重量: {weight_value} (原值: {weight_str})")
@@ -1507,59 +1632,18 @@ class AmazonProductParser:
                 print(f"解析产品详情重量失败: {e}")
         
         # 策略2: 尝试直接定位重量元素（如果上面没有找到）
+        # 整个选择器级联连同磅单位正则都在一次evaluate内完成——此时DOM已稳定，
+        # 不再需要逐选择器的wait_for_selector及其最长3秒超时
         if weight_value == '10':  # 还是默认值，说明上面没找到
-            weight_selectors = [
-                # 策略2a: 原始选择器
-                "td:has-text('Item Weight') span.a-size-base.handle-overflow",
-                # 策略2b: 简化选择器
-                "td:has-text('Item Weight') span",
-                # 策略2c: 更宽泛的选择器
-                "td:has-text('Item Weight')",
-                # 策略2d: 包含weight的所有元素
-                "[data-feature-name*='weight'], [id*='weight'], .weight-info",
-                # 策略2e: 产品详情表格中的重量
-                "#productDetails_detailBullets_sections1 span:has-text('pounds'), #productDetails_detailBullets_sections1 span:has-text('lbs')"
-            ]
-            
-            for i, selector in enumerate(weight_selectors, 1):
-                try:
-                    print(f"🔍 尝试策略 {i}: {selector[:50]}...")
-                    # 使用较短的超时时间
-                    self.page.wait_for_selector(selector.split()[0], timeout=3000)
-                    
-                    elements = self.page.locator(selector)
-                    count = elements.count()
-                    print(f"   找到 {count} 个匹配元素")
-                    
-                    for j in range(count):
-                        try:
-                            element_text = elements.nth(j).inner_text(timeout=5000)
-                            print(f"   元素 {j+1} 文本: {element_text[:50]}...")
-                            
-                            # 提取数字
-                            weight_match = re.search(r'([0-9.]+)\s*(?:pounds?|lbs?)', element_text, re.IGNORECASE)
-                            if weight_match:
-                                weight_value = weight_match.group(1)
-                                print(f"✅ 使用策略 {i} 获取重量: {weight_value}")
-                                break
-                            
-                            # 如果没有单位，尝试提取任意数字
-                            number_match = re.search(r'([0-9.]+)', element_text)
-                            if number_match and selector == weight_selectors[0]:  # 只在精确选择器下使用
-                                weight_value = number_match.group(1)
-                                print(f"✅ 使用策略 {i} 获取数字: {weight_value}")
-                                break
-                                
-                        except Exception as element_error:
-                            print(f"   元素 {j+1} 处理失败: {element_error}")
-                            continue
-                    
-                    if weight_value != '10':  # 找到了
-                        break
-                        
-                except Exception as selector_error:
-                    print(f"   策略 {i} 失败: {selector_error}")
-                    continue
+            try:
+                found = self.page.evaluate(_WEIGHT_CASCADE_JS, _WEIGHT_SELECTORS)
+                if found:
+                    weight_value = found
+                    print(f"✅ 从重量选择器级联获取重量: {weight_value}")
+                else:
+                    print("⚠️ 重量选择器级联未命中，使用默认值")
+            except Exception as e:
+                print(f"   重量选择器级联失败: {e}")
         
         # 设置最终重量值
         self.product_data.weight_value = weight_value
@@ -1580,37 +1664,48 @@ class AmazonProductParser:
             
             # 等待一下让展开动画完成
             self.page.wait_for_timeout(1000)
-            
+
             # 检查元素是否存在
             print("🔍 检查底部表格存在性...")
-            bottom_tables = self.page.locator(self.selectors['product_table_bottom'])
-            count = bottom_tables.count()
+            bottom_tables_loc = self.page.locator(self.selectors['product_table_bottom'])
+            bottom_tables = bottom_tables_loc.all()
+            count = len(bottom_tables)
             print(f"📊 找到底部表格数量: {count}")
-            
+
             if count == 0:
                 print("⚠️ 未找到任何底部表格，跳过")
                 return
-            
-            # 智能处理：检查每个表格的可见性
+
+            # 一次evaluate_all取回全部表格的可见性，替代逐表最长3秒的wait_for
+            _visibility_probe_js = (
+                "els => els.map(e => {"
+                " const s = getComputedStyle(e);"
+                " return s.display !== 'none' && s.visibility !== 'hidden'"
+                "     && e.offsetParent !== null;"
+                " })"
+            )
+            visible_flags = bottom_tables_loc.evaluate_all(_visibility_probe_js)
+
+            # 展开动画可能还没结束——有不可见表格时稍候重探一次，
+            # 避免把仍在展开中的表格当作不可见而丢掉其键值详情
+            if not all(visible_flags):
+                self.page.wait_for_timeout(500)
+                retry_flags = bottom_tables_loc.evaluate_all(_visibility_probe_js)
+                visible_flags = [a or b for a, b in zip(visible_flags, retry_flags)]
+
             visible_count = 0
-            for i in range(count):
+            for i, (table, visible) in enumerate(zip(bottom_tables, visible_flags)):
                 try:
-                    table = bottom_tables.nth(i)
-                    
-                    # 检查这个表格是否可见
-                    try:
-                        # 短时间等待这个特定表格变为可见
-                        table.wait_for(state="visible", timeout=3000)
-                        visible_count += 1
-                        print(f"✅ 表格 {i+1} 已可见，开始解析...")
-                        
-                        # 使用结构化方法解析这个表格
-                        self._parse_single_table_structured(table, f"底部表格 {i+1}")
-                        
-                    except Exception as visibility_error:
-                        print(f"⚠️ 表格 {i+1} 不可见或等待超时，跳过: {visibility_error}")
+                    if not visible:
+                        print(f"⚠️ 表格 {i+1} 不可见，跳过")
                         continue
-                        
+
+                    visible_count += 1
+                    print(f"✅ 表格 {i+1} 已可见，开始解析...")
+
+                    # 使用结构化方法解析这个表格
+                    self._parse_single_table_structured(table, f"底部表格 {i+1}")
+
                 except Exception as table_error:
                     print(f"⚠️ 第 {i+1} 个底部表格处理失败: {table_error}")
                     continue
@@ -1621,58 +1716,73 @@ class AmazonProductParser:
             print(f"⚠️ 底部产品详情获取失败: {e}")
     
     def _parse_table(self, selector: str, table_name: str) -> None:
-        """解析单个表格"""
+        """解析单个表格 - 一次evaluate在DOM遍历时直接取回键值对"""
         try:
             self.page.wait_for_selector(selector, state="attached", timeout=5000)
-            table_text = self.page.locator(selector).inner_text()
-            self._parse_table_text(table_text)
+            # 浏览器端按单元格结构取对，免去inner_text文本的二次切分，
+            # 也不再依赖序列化文本中是否保留\t分隔符
+            pairs = self.page.locator(selector).evaluate(_CELL_PAIRS_JS)
+            # 一次批量update替代逐键方法调用
+            self.product_data.add_details(dict(pairs))
             print(f"✅ {table_name} 解析完成")
         except Exception as e:
             print(f"⚠️ {table_name} 解析失败: {e}")
     
-    def _parse_table_text(self, table_text: str) -> None:
-        """解析表格文本内容"""
-        lines = table_text.strip().split('\n')
-        for line in lines:
-            if '\t' in line:
-                key, value = line.split('\t', 1)
-                self.product_data.add_detail(key, value)
-    
     def _expand_product_details_sections(self) -> None:
-        """展开所有产品详情可扩展区域"""
+        """展开所有产品详情可扩展区域 - 一次evaluate在浏览器内完成全部点击"""
         try:
             print("🔍 查找并展开产品详情区域...")
-            
-            # 查找所有可扩展的产品详情区域
+
+            # 一趟JS遍历去重后的展开器集合并点击未展开的，
+            # 替代逐选择器、逐元素的get_attribute/is_visible/click往返
+            try:
+                expanded_count = self.page.evaluate(_EXPAND_SECTIONS_JS)
+                if expanded_count:
+                    # 短暂等待展开动画
+                    self.page.wait_for_timeout(300)
+                print(f"✅ 成功展开 {expanded_count} 个产品详情区域")
+                return
+            except Exception as e:
+                print(f"  ⚠️ 批量展开失败，回退到逐个点击: {str(e)[:50]}...")
+
+            # 回退路径：逐选择器、逐元素点击（原实现）
             expander_selectors = [
                 # 主要的产品详情展开器
                 "a.a-expander-header[data-action='a-expander-toggle']",
-                # 带有 Item details 文本的展开器
-                "a.a-expander-header:has-text('Item details')",
                 # 产品详情区域的展开器
                 ".a-expander-container .a-expander-header",
                 # 更通用的展开器选择器
                 "[data-action='a-expander-toggle']"
             ]
-            
+
+            # 一次evaluate取回全部已展开的展开器id，循环内只查本地set，
+            # 替代逐元素带2秒超时的get_attribute往返
+            try:
+                already_expanded_ids = set(self.page.evaluate(
+                    "() => Array.from(document.querySelectorAll("
+                    "\"a.a-expander-header[aria-expanded='true']\""
+                    ")).map(e => e.id || '')"
+                ))
+            except Exception:
+                already_expanded_ids = set()
+
             expanded_count = 0
             for selector in expander_selectors:
                 try:
-                    expanders = self.page.locator(selector)
-                    count = expanders.count()
-                    
-                    if count > 0:
-                        print(f"  找到 {count} 个展开器 (选择器: {selector[:40]}...)")
-                        
-                        for i in range(count):
+                    # all()一次取回全部元素引用，替代count()加逐个nth(i)
+                    expanders = self.page.locator(selector).all()
+
+                    if expanders:
+                        print(f"  找到 {len(expanders)} 个展开器 (选择器: {selector[:40]}...)")
+
+                        for i, expander in enumerate(expanders):
                             try:
-                                expander = expanders.nth(i)
-                                
-                                # 检查是否已经展开 - 缩短超时时间
+
+                                # 检查是否已经展开 - 本地set查询
                                 try:
-                                    aria_expanded = expander.get_attribute("aria-expanded", timeout=2000)  # 减少到2秒
-                                    if aria_expanded == "true":
-                                        print(f"    展开器 {i+1} 已经展开，跳过")
+                                    expander_id = expander.get_attribute("id")
+                                    if expander_id and expander_id in already_expanded_ids:
+                                        logger.debug("    展开器 %d 已经展开，跳过", i + 1)
                                         continue
                                 except Exception:
                                     # 如果获取属性失败，继续尝试点击
@@ -1683,12 +1793,12 @@ class AmazonProductParser:
                                     if expander.is_visible(timeout=1000):  # 减少到1秒
                                         expander.click(timeout=3000)  # 减少到3秒
                                         expanded_count += 1
-                                        print(f"    ✅ 展开器 {i+1} 点击成功")
+                                        logger.debug("    ✅ 展开器 %d 点击成功", i + 1)
                                         
                                         # 短暂等待展开动画
                                         self.page.wait_for_timeout(300)  # 减少等待时间
                                     else:
-                                        print(f"    ⚠️ 展开器 {i+1} 不可见，跳过")
+                                        logger.debug("    ⚠️ 展开器 %d 不可见，跳过", i + 1)
                                 except Exception as click_error:
                                     print(f"    ⚠️ 展开器 {i+1} 点击失败(快速跳过): {str(click_error)[:50]}...")
                                     continue
@@ -1706,36 +1816,23 @@ class AmazonProductParser:
             print(f"⚠️ 展开产品详情区域失败: {e}")
     
     def _parse_single_table_structured(self, table_element, table_name: str) -> None:
-        """解析单个结构化表格 (th/td格式)"""
+        """解析单个结构化表格 (th/td格式) - 一次evaluate取回全部键值对"""
         try:
-            # 查找所有的tr元素
-            tr_elements = table_element.locator("tr")
-            
-            parsed_count = 0
-            for i in range(tr_elements.count()):
-                try:
-                    tr = tr_elements.nth(i)
-                    # 查找th和td元素
-                    th_elements = tr.locator("th")
-                    td_elements = tr.locator("td")
-                    
-                    # 确保有一个th和一个td
-                    if th_elements.count() >= 1 and td_elements.count() >= 1:
-                        key = th_elements.first.inner_text().strip()
-                        # 对于td中的复杂内容，我们只取文本部分
-                        value = td_elements.first.inner_text().strip()
-                        
-                        # 过滤掉空值
-                        if key and value:
-                            # 清理值中的多余空白字符
-                            value = re.sub(r'\s+', ' ', value).strip()
-                            self.product_data.add_detail(key, value)
-                            parsed_count += 1
-                            print(f"  ✅ {key}: {value[:50]}{'...' if len(value) > 50 else ''}")
-                except Exception as e:
-                    print(f"  ❌ 表格行 {i+1} 解析失败: {e}")
-            
-            print(f"✅ {table_name} 结构化解析完成，共提取 {parsed_count} 个属性")
+            pairs = table_element.evaluate(_TABLE_ROWS_JS)
+
+            # 先在本地字典清洗聚合，最后一次批量update替代逐键方法调用
+            ws_sub = _WS_RE.sub
+            cleaned = {}
+            for key, value in pairs:
+                # 过滤掉空值
+                if key and value:
+                    # 清理值中的多余空白字符 - JS侧已trim过，无需再strip
+                    value = ws_sub(' ', value)
+                    cleaned[key] = value
+                    logger.debug("  ✅ %s: %.50s", key, value)
+
+            self.product_data.add_details(cleaned)
+            print(f"✅ {table_name} 结构化解析完成，共提取 {len(cleaned)} 个属性")
         except Exception as e:
             print(f"⚠️ {table_name} 结构化解析失败: {e}")
 
@@ -1744,29 +1841,17 @@ class AmazonProductParser:
         try:
             self.page.wait_for_selector(self.selectors['glance_icons'], timeout=1000)
             glance_icons = self.page.locator(self.selectors['glance_icons'])
-            bold_elements = glance_icons.locator("span.a-text-bold")
-            
-            extracted_count = 0
-            for i in range(bold_elements.count()):
-                try:
-                    # 获取标题
-                    title_element = bold_elements.nth(i)
-                    title = title_element.inner_text().strip()
-                    
-                    # 获取值
-                    parent_td = title_element.locator("xpath=ancestor::td[1]")
-                    value_spans = parent_td.locator("span.handle-overflow:not(.a-text-bold)")
-                    
-                    if value_spans.count() > 0:
-                        value = value_spans.first.inner_text().strip()
-                        self.product_data.add_detail(title, value)
-                        extracted_count += 1
-                        print(f"  ✅ {title}: {value}")
-                
-                except Exception as e:
-                    print(f"  ❌ 第{i+1}个特征提取失败: {e}")
-            
-            print(f"✅ 从产品特征区域提取了 {extracted_count} 个属性")
+
+            # 一次evaluate取回全部 [标题, 值] 对，替代逐元素的XPath父节点爬升
+            pairs = glance_icons.evaluate(_GLANCE_PAIRS_JS)
+
+            # 一次批量update替代逐键方法调用
+            extracted = {title: value for title, value in pairs if title and value}
+            self.product_data.add_details(extracted)
+            for title, value in extracted.items():
+                logger.debug("  ✅ %s: %s", title, value)
+
+            print(f"✅ 从产品特征区域提取了 {len(extracted)} 个属性")
             
         except Exception as e:
             print(f"⚠️ 产品特征区域解析失败: {e}")
@@ -1776,17 +1861,17 @@ class AmazonProductParser:
         try:
             self.page.wait_for_selector("#feature-bullets", timeout=3000)
             feature_bullets = self.page.locator(self.selectors['feature_bullets'])
-            
-            # 提取所有功能特点
+
+            # evaluate_all一次取回全部功能特点文本，替代逐条count/nth/inner_text往返
+            bullet_texts = feature_bullets.evaluate_all(
+                "els => els.map(e => e.innerText.trim())"
+            )
+
             feature_descriptions = []
-            for i in range(feature_bullets.count()):
-                try:
-                    feature_text = feature_bullets.nth(i).inner_text().strip()
-                    if feature_text and len(feature_text) > 10:  # 过滤太短的文本
-                        feature_descriptions.append(feature_text)
-                        print(f"  ✅ 功能特点 {i+1}: {feature_text[:60]}...")
-                except Exception as e:
-                    print(f"  ❌ 第{i+1}个功能特点提取失败: {e}")
+            for i, feature_text in enumerate(bullet_texts):
+                if feature_text and len(feature_text) > 10:  # 过滤太短的文本
+                    feature_descriptions.append(feature_text)
+                    logger.debug("  ✅ 功能特点 %d: %.60s...", i + 1, feature_text)
             
             if feature_descriptions:
                 # 处理功能描述
@@ -1806,58 +1891,86 @@ class AmazonProductParser:
         self.product_data.add_detail('Key Features', combined_features)
         
         features_text = combined_features.lower()
-        
+
+        # 一次分词构建token集合，单词类关键词用哈希交集判断
+        tokens = frozenset(_TOKEN_RE.findall(features_text))
+
+        # 一次快照已存在的智能提取键，循环间通过skip显式传递状态，
+        # 免去各提取器对共享可变dict的重复成员查询
+        skip = set(self.product_data.details.keys() & _SMART_EXTRACT_KEYS)
+
         # 智能提取各种属性
-        self._extract_material(features_text)
-        self._extract_weight_capacity(features_text)
+        self._extract_material(features_text, tokens, skip)
+        self._extract_weight_capacity(features_text, skip)
         self._extract_assembly_info(features_text)
-        self._extract_style(features_text)
-        self._extract_room_type(features_text)
+        self._extract_style(features_text, tokens, skip)
+        self._extract_room_type(features_text, skip)
     
-    def _extract_material(self, text: str) -> None:
-        """提取材质信息"""
-        for material in self.keywords['materials']:
-            if material in text and 'Material' not in self.product_data.details:
-                self.product_data.add_detail('Material', material.capitalize())
-                print(f"  ✨ 智能提取材质: {material.capitalize()}")
-                break
+    def _extract_material(self, text: str, tokens: frozenset, skip: set) -> None:
+        """提取材质信息 - token交集快速通道，未命中再做正则扫描兜底"""
+        if 'Material' in skip:
+            return
+        material = next(
+            (word for word in self._single_word_keywords['materials'] if word in tokens),
+            None,
+        )
+        if material is None:
+            # 兜底同样按基线列表顺序取优先命中，而不是文本中的最左命中
+            found = {m.lower() for m in self._keyword_patterns['materials'].findall(text)}
+            material = next((word for word in self.keywords['materials'] if word in found), None)
+        if material:
+            self.product_data.add_detail('Material', material.capitalize())
+            skip.add('Material')
+            print(f"  ✨ 智能提取材质: {material.capitalize()}")
     
-    def _extract_weight_capacity(self, text: str) -> None:
+    def _extract_weight_capacity(self, text: str, skip: set) -> None:
         """提取承重信息"""
-        weight_pattern = r'(\d+)\s*(?:lb|lbs|pound|pounds)'
-        weight_matches = re.findall(weight_pattern, text)
-        if weight_matches and 'Max Weight Capacity' not in self.product_data.details:
+        if 'Max Weight Capacity' in skip:
+            return
+        weight_matches = _WEIGHT_CAPACITY_RE.findall(text)
+        if weight_matches:
             max_weight = max([int(w) for w in weight_matches])
             self.product_data.add_detail('Max Weight Capacity', f"{max_weight} lbs")
+            skip.add('Max Weight Capacity')
             print(f"  ✨ 智能提取承重: {max_weight} lbs")
     
     def _extract_assembly_info(self, text: str) -> None:
         """提取组装信息"""
-        if any(keyword in text for keyword in self.keywords['assembly_no_tools']):
+        if self._keyword_patterns['assembly_no_tools'].search(text):
             self.product_data.add_detail('Assembly Required', 'No')
             self.product_data.add_detail('Assembly Type', 'Tool-Free')
             print("  ✨ 智能提取组装信息: 无需工具")
-        elif any(keyword in text for keyword in self.keywords['assembly_required']):
+        elif self._keyword_patterns['assembly_required'].search(text):
             self.product_data.add_detail('Assembly Required', 'Yes')
             print("  ✨ 智能提取组装信息: 需要组装")
-    
-    def _extract_style(self, text: str) -> None:
-        """提取风格信息"""
-        for style in self.keywords['styles']:
-            if style in text and 'Style' not in self.product_data.details:
-                self.product_data.add_detail('Style', style.capitalize())
-                print(f"  ✨ 智能提取风格: {style.capitalize()}")
-                break
-    
-    def _extract_room_type(self, text: str) -> None:
+
+    def _extract_style(self, text: str, tokens: frozenset, skip: set) -> None:
+        """提取风格信息 - token交集快速通道，未命中再做正则扫描兜底"""
+        if 'Style' in skip:
+            return
+        style = next(
+            (word for word in self._single_word_keywords['styles'] if word in tokens),
+            None,
+        )
+        if style is None:
+            # 兜底同样按基线列表顺序取优先命中，而不是文本中的最左命中
+            found = {m.lower() for m in self._keyword_patterns['styles'].findall(text)}
+            style = next((word for word in self.keywords['styles'] if word in found), None)
+        if style:
+            self.product_data.add_detail('Style', style.capitalize())
+            skip.add('Style')
+            print(f"  ✨ 智能提取风格: {style.capitalize()}")
+
+    def _extract_room_type(self, text: str, skip: set) -> None:
         """提取适用房间信息"""
-        found_rooms = []
-        for room in self.keywords['rooms']:
-            if room in text:
-                found_rooms.append(room.title())
-        
-        if found_rooms and 'Room Type' not in self.product_data.details:
+        if 'Room Type' in skip:
+            return
+        # dict.fromkeys 去重并保持文本中的出现顺序
+        found_rooms = [room.title() for room in dict.fromkeys(self._keyword_patterns['rooms'].findall(text))]
+
+        if found_rooms:
             self.product_data.add_detail('Room Type', ', '.join(found_rooms))
+            skip.add('Room Type')
             print(f"  ✨ 智能提取适用房间: {', '.join(found_rooms)}")
     
     def _add_error(self, error_msg: str) -> None:
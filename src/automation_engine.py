@@ -13,6 +13,7 @@
 - Clean separation between data extraction and form filling
 """
 
+from dataclasses import asdict, dataclass
 from typing import Dict, Type, Optional, Any
 from playwright.sync_api import BrowserContext, Page
 
@@ -22,6 +23,18 @@ from core.system_config import SYSTEM_CONFIG
 from websites.base.website_strategy import WebsiteStrategy
 
 
+@dataclass(slots=True)
+class _Stats:
+    """自动化执行统计 - slots固定字段，属性访问替代字典哈希查找"""
+
+    total_runs: int = 0
+    successful_runs: int = 0
+    failed_runs: int = 0
+    amazon_parse_failures: int = 0
+    authentication_failures: int = 0
+    form_fill_failures: int = 0
+
+
 class AutomationEngine:
     """
     统一自动化引擎 - 协调Amazon抓取和多网站填充
@@ -34,14 +47,12 @@ class AutomationEngine:
         self.strategies: Dict[str, WebsiteStrategy] = {}
         
         # 自动化统计
-        self.stats = {
-            'total_runs': 0,
-            'successful_runs': 0,
-            'failed_runs': 0,
-            'amazon_parse_failures': 0,
-            'authentication_failures': 0,
-            'form_fill_failures': 0
-        }
+        self.stats = _Stats()
+
+        # 常用配置在启动时取好，避免每次抓取重复查询SYSTEM_CONFIG
+        self._amazon_url_params = SYSTEM_CONFIG.get_amazon_url_params()
+        self._navigation_timeout = SYSTEM_CONFIG.get_timeout('navigation')
+        self._long_timeout = SYSTEM_CONFIG.get_timeout('long')
     
     def register_strategy(self, strategy: WebsiteStrategy) -> None:
         """
@@ -81,7 +92,7 @@ class AutomationEngine:
         """
         print(f"🚀 开始多网站自动化流程: {amazon_url} -> {target_site}")
         
-        self.stats['total_runs'] += 1
+        self.stats.total_runs += 1
         
         try:
             # 1. 验证目标网站
@@ -96,7 +107,7 @@ class AutomationEngine:
             product_data = self._extract_amazon_data(amazon_url, context)
             
             if not product_data.has_valid_data():
-                self.stats['amazon_parse_failures'] += 1
+                self.stats.amazon_parse_failures += 1
                 raise Exception("Amazon数据抓取失败，无有效产品数据")
             
             print(f"✅ Amazon数据抓取成功: {len(product_data.details)}个字段")
@@ -111,7 +122,7 @@ class AutomationEngine:
             # 4. 网站认证
             print(f"🔐 步骤3: {target_site}认证...")
             if not strategy.authenticate(page, context):
-                self.stats['authentication_failures'] += 1
+                self.stats.authentication_failures += 1
                 raise Exception(f"{target_site}认证失败")
             
             print(f"✅ {target_site}认证成功")
@@ -130,13 +141,13 @@ class AutomationEngine:
             fill_result = strategy.fill_form(form_handle, product_data)
             
             if not fill_result or fill_result.get('successful_fills', 0) == 0:
-                self.stats['form_fill_failures'] += 1
+                self.stats.form_fill_failures += 1
                 raise Exception(f"{target_site}表单填充失败")
             
             print(f"✅ {target_site}表单填充完成")
             
             # 成功统计
-            self.stats['successful_runs'] += 1
+            self.stats.successful_runs += 1
             
             return {
                 'success': True,
@@ -148,7 +159,7 @@ class AutomationEngine:
             }
             
         except Exception as e:
-            self.stats['failed_runs'] += 1
+            self.stats.failed_runs += 1
             error_msg = str(e)
             
             print(f"❌ 自动化执行失败: {error_msg}")
@@ -175,13 +186,13 @@ class AutomationEngine:
         
         try:
             # 构建带参数的URL
-            full_url = amazon_url + SYSTEM_CONFIG.get_amazon_url_params()
+            full_url = amazon_url + self._amazon_url_params
             print(f"🌐 导航到Amazon页面: {full_url}")
             
-            amazon_page.goto(full_url, timeout=SYSTEM_CONFIG.get_timeout('navigation'))
+            amazon_page.goto(full_url, timeout=self._navigation_timeout)
             
             # 等待页面加载
-            amazon_page.wait_for_load_state("networkidle", timeout=SYSTEM_CONFIG.get_timeout('long'))
+            amazon_page.wait_for_load_state("networkidle", timeout=self._long_timeout)
             
             # 检查配送地址（可选）
             try:
@@ -203,11 +214,11 @@ class AutomationEngine:
     
     def _get_execution_stats(self) -> Dict[str, Any]:
         """获取执行统计信息"""
-        total = self.stats['total_runs']
-        success_rate = (self.stats['successful_runs'] / total * 100) if total > 0 else 0
+        total = self.stats.total_runs
+        success_rate = (self.stats.successful_runs / total * 100) if total > 0 else 0
         
         return {
-            **self.stats,
+            **asdict(self.stats),
             'success_rate': round(success_rate, 1)
         }
     
@@ -217,14 +228,7 @@ class AutomationEngine:
     
     def reset_stats(self) -> None:
         """重置统计信息"""
-        self.stats = {
-            'total_runs': 0,
-            'successful_runs': 0,
-            'failed_runs': 0,
-            'amazon_parse_failures': 0,
-            'authentication_failures': 0,
-            'form_fill_failures': 0
-        }
+        self.stats = _Stats()
     
     def print_summary(self) -> None:
         """打印执行摘要"""
@@ -8,28 +8,50 @@ promptly while avoiding unnecessary network calls on every launch.
 """
 from __future__ import annotations
 
+import hmac
 import json
+import logging
+import os
+import sys
+import threading
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from getpass import getpass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
-
 try:  # pragma: no cover - runtime fallback when packaged differently
     from runtime_env import get_env
 except ImportError:  # pragma: no cover
     from .runtime_env import get_env  # type: ignore
 
-try:  # pragma: no cover - lazy optional import
-    import bcrypt  # type: ignore
-except Exception:  # pragma: no cover - handled during runtime validation
-    bcrypt = None  # type: ignore
+# requests/bcrypt 按需在函数内导入：缓存仍然有效的快速路径
+# （ensure_authorized 直接放行）不需要加载网络和加密依赖
+
+try:  # pragma: no cover - 可选的C实现JSON加速器
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - 回退到标准库json
+    orjson = None  # type: ignore
+
+# 已确认存在的状态目录：重复构造manager时跳过stat+mkdir系统调用
+_ENSURED_DIRS: set = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+# 默认状态目录在模块导入时解析一次，构造manager不再重复lstat整条路径
+_DEFAULT_STATE_DIR = Path(__file__).resolve().parent.parent / "data" / "auth_states"
 
 
 UTC = timezone.utc
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _cfg(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Memoized ``get_env``：Supabase列名等配置在进程内不变，只查一次。"""
+    return get_env(name, default) or default
+
 
 class ClientAuthorizationError(RuntimeError):
     """Raised when the client authorization flow fails."""
@@ -45,12 +67,20 @@ class AuthorizationState:
     validated_at: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def expires_at_iso(self) -> str:
+        return self.expires_at.astimezone(UTC).isoformat()
+
+    @cached_property
+    def validated_at_iso(self) -> str:
+        return self.validated_at.astimezone(UTC).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "username": self.username,
             "status": self.status,
-            "expires_at": self.expires_at.astimezone(UTC).isoformat(),
-            "validated_at": self.validated_at.astimezone(UTC).isoformat(),
+            "expires_at": self.expires_at_iso,
+            "validated_at": self.validated_at_iso,
             "metadata": self.metadata,
         }
 
@@ -76,21 +106,76 @@ class ClientAuthorizationManager:
 
     STATE_FILENAME = "client_authorization_state.json"
 
+    # 状态归一化集合为类常量，避免每次校验重新构建set
+    _DISABLED_STATUSES = frozenset({"disabled", "inactive", "false", "0"})
+    _ACTIVE_STATUSES = frozenset({"active", "enabled", "true", "1"})
+
     def __init__(self, state_dir: Optional[Path] = None) -> None:
-        base_dir = Path(__file__).resolve().parent
-        project_root = base_dir.parent
-        default_state_dir = project_root / "data" / "auth_states"
-        self.state_dir = (state_dir or default_state_dir).resolve()
-        self.state_dir.mkdir(parents=True, exist_ok=True)
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        if state_dir is None:
+            self.state_dir = _DEFAULT_STATE_DIR
+        else:
+            state_dir = Path(state_dir)
+            # 绝对路径无需resolve，省掉逐级lstat
+            self.state_dir = state_dir if state_dir.is_absolute() else state_dir.resolve()
+        if self.state_dir not in _ENSURED_DIRS:
+            with _ENSURED_DIRS_LOCK:
+                if self.state_dir not in _ENSURED_DIRS:
+                    self.state_dir.mkdir(parents=True, exist_ok=True)
+                    _ENSURED_DIRS.add(self.state_dir)
         self.state_path = self.state_dir / self.STATE_FILENAME
 
         self.supabase_url = self._require_env("SUPABASE_URL")
         self.supabase_api_key = self._require_env("SUPABASE_API_KEY")
-        self.supabase_table = get_env("SUPABASE_CLIENT_TABLE", "client_licenses") or "client_licenses"
-        self.username_column = get_env("SUPABASE_USERNAME_COLUMN", "username") or "username"
-        self.password_column = get_env("SUPABASE_PASSWORD_COLUMN", "password_hash") or "password_hash"
-        self.status_column = get_env("SUPABASE_STATUS_COLUMN", "status") or "status"
-        self.expires_column = get_env("SUPABASE_EXPIRES_COLUMN", "expires_at") or "expires_at"
+        self.supabase_table = _cfg("SUPABASE_CLIENT_TABLE", "client_licenses")
+        self.username_column = _cfg("SUPABASE_USERNAME_COLUMN", "username")
+        self.password_column = _cfg("SUPABASE_PASSWORD_COLUMN", "password_hash")
+        self.status_column = _cfg("SUPABASE_STATUS_COLUMN", "status")
+        self.expires_column = _cfg("SUPABASE_EXPIRES_COLUMN", "expires_at")
+        # 重新校验间隔：默认24小时，可通过 AUTH_REFRESH_SECONDS 调整
+        self.refresh_interval = timedelta(
+            seconds=int(_cfg("AUTH_REFRESH_SECONDS", "86400"))
+        )
+
+        # Supabase REST 端点和请求头在整个生命周期内不变，提前构建好
+        self._rest_url = f"{self.supabase_url.rstrip('/')}/rest/v1/{self.supabase_table}"
+        # 只取校验真正需要的列，减少传输字节和JSON解析量
+        self._select_columns = ",".join(
+            dict.fromkeys(
+                (
+                    self.username_column,
+                    self.password_column,
+                    self.status_column,
+                    self.expires_column,
+                )
+            )
+        )
+        self._request_headers = {
+            "apikey": self.supabase_api_key,
+            "Authorization": f"Bearer {self.supabase_api_key}",
+            "Accept": "application/json",
+        }
+
+        # 按文件mtime缓存已解析的状态，同进程内重复调用免去JSON解析
+        self._state_cache: Optional[tuple[int, AuthorizationState]] = None
+
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """复用同一个Session：重试校验时省掉重复的TCP+TLS握手。
+
+        惰性构建，首次真正访问网络时才导入 requests。
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._request_headers)
+        return session
 
     # ------------------------------------------------------------------
     # Public API
@@ -111,37 +196,76 @@ class ClientAuthorizationManager:
 
         now = datetime.now(UTC)
         if cached_state and self._is_state_valid_for_today(cached_state, now):
-            print(
-                f"🔐 授权有效（账号: {cached_state.username}，有效期至 "
-                f"{cached_state.expires_at.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%SZ')}）。"
+            logger.info(
+                "🔐 授权有效（账号: %s，有效期至 %s）。",
+                cached_state.username,
+                cached_state.expires_at.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%SZ'),
             )
             return cached_state
 
+        # stale-while-revalidate：许可尚未到期且凭据可从环境取得时，
+        # 先用缓存放行，再在后台线程静默刷新，省掉启动时的同步网络往返
+        if cached_state and cached_state.expires_at > now:
+            env_password = get_env("CLIENT_AUTH_PASSWORD", "") or ""
+            if env_username and env_password:
+                logger.info(
+                    "🔐 授权有效（账号: %s，后台刷新校验中）。",
+                    cached_state.username,
+                )
+                threading.Thread(
+                    target=self._refresh_in_background,
+                    args=(Credentials(username=env_username, password=env_password),),
+                    daemon=True,
+                ).start()
+                return cached_state
+
         credentials = self._collect_credentials(cached_state)
         record = self._fetch_user_record(credentials.username)
         self._verify_password(credentials.password, record)
 
         refreshed_state = self._build_state(record, credentials.username, now)
         self._save_state(refreshed_state)
-        print(
-            f"✅ 授权校验成功（账号: {refreshed_state.username}，"
-            f"有效期至 {refreshed_state.expires_at.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%SZ')}）。"
+        logger.info(
+            "✅ 授权校验成功（账号: %s，有效期至 %s）。",
+            refreshed_state.username,
+            refreshed_state.expires_at.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%SZ'),
         )
         return refreshed_state
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _refresh_in_background(self, credentials: Credentials) -> None:
+        """Re-validate against Supabase and rewrite the cached state.
+
+        Runs on a daemon thread after a stale-but-unexpired cache has already
+        been served, so failures must never interrupt the main flow.
+        """
+        try:
+            record = self._fetch_user_record(credentials.username)
+            self._verify_password(credentials.password, record)
+            refreshed = self._build_state(record, credentials.username, datetime.now(UTC))
+            self._save_state(refreshed)
+        except Exception as exc:  # pragma: no cover - best-effort refresh
+            logger.warning("⚠️ 后台授权刷新失败，下次启动将重新验证。原因: %s", exc)
+
     def _load_state(self) -> Optional[AuthorizationState]:
-        if not self.state_path.exists():
-            return None
         try:
-            with self.state_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            return AuthorizationState.from_dict(payload)
+            mtime_ns = self.state_path.stat().st_mtime_ns
+            if self._state_cache and self._state_cache[0] == mtime_ns:
+                return self._state_cache[1]
+            raw = self.state_path.read_bytes()
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            state = AuthorizationState.from_dict(payload)
+            self._state_cache = (mtime_ns, state)
+            return state
+        except FileNotFoundError:
+            return None
         except Exception as exc:  # pragma: no cover - defensive
-            print(
-                f"⚠️ 授权状态文件损坏或不可读取（{self.state_path}），将进行重新验证。原因: {exc}"
+            logger.warning(
+                "⚠️ 授权状态文件损坏或不可读取（%s），将进行重新验证。原因: %s",
+                self.state_path,
+                exc,
             )
             try:
                 self.state_path.unlink()
@@ -150,9 +274,16 @@ class ClientAuthorizationManager:
             return None
 
     def _save_state(self, state: AuthorizationState) -> None:
-        payload = state.to_dict()
-        with self.state_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload_bytes = orjson.dumps(state.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            payload_bytes = json.dumps(
+                state.to_dict(), ensure_ascii=False, indent=2
+            ).encode("utf-8")
+        # 先写临时文件再原子替换，进程中途崩溃也不会留下残缺的状态文件
+        tmp_path = self.state_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload_bytes)
+        os.replace(tmp_path, self.state_path)
 
     def _collect_credentials(
         self, cached_state: Optional[AuthorizationState]
@@ -187,21 +318,26 @@ class ClientAuthorizationManager:
         return Credentials(username=username, password=password)
 
     def _fetch_user_record(self, username: str) -> Dict[str, Any]:
-        resource = f"{self.supabase_url.rstrip('/')}/rest/v1/{self.supabase_table}"
         params = {
             self.username_column: f"eq.{username}",
-            "select": "*",
+            "select": self._select_columns,
             "limit": 1,
         }
-        headers = {
-            "apikey": self.supabase_api_key,
-            "Authorization": f"Bearer {self.supabase_api_key}",
-            "Accept": "application/json",
-        }
+        import requests
+
         try:
-            response = requests.get(resource, params=params, headers=headers, timeout=10)
+            response = self._session.get(
+                self._rest_url,
+                params=params,
+                headers={"Prefer": "count=none"},
+                timeout=10,
+            )
             response.raise_for_status()
-            records = response.json()
+            # orjson直接解析原始字节，跳过requests的编码探测路径
+            if orjson is not None:
+                records = orjson.loads(response.content)
+            else:
+                records = response.json()
         except requests.RequestException as exc:
             raise ClientAuthorizationError(f"无法连接 Supabase 服务: {exc}") from exc
         except ValueError as exc:
@@ -210,23 +346,49 @@ class ClientAuthorizationManager:
         if not isinstance(records, list) or not records:
             raise ClientAuthorizationError("授权账号不存在或已被移除。")
 
-        return records[0]
+        record = records[0]
+        # 密码哈希提前编码为bytes，重试校验时不再重复UTF-8编码
+        secret = record.get(self.password_column)
+        if isinstance(secret, str):
+            record[self.password_column] = secret.encode("utf-8")
+        return record
 
     def _verify_password(self, password: str, record: Dict[str, Any]) -> None:
         stored_secret = record.get(self.password_column) or record.get("password")
         if stored_secret is None:
             raise ClientAuthorizationError("授权数据缺少密码信息，请联系管理员。")
 
-        if isinstance(stored_secret, str) and stored_secret.startswith("$2"):
-            if bcrypt is None:
+        if isinstance(stored_secret, bytes):
+            stored_bytes = stored_secret
+        else:
+            stored_bytes = str(stored_secret).encode("utf-8")
+
+        if stored_bytes.startswith(b"$2"):
+            try:
+                import bcrypt  # type: ignore
+            except Exception as exc:  # pragma: no cover - optional dependency
                 raise ClientAuthorizationError(
                     "服务器使用 bcrypt 哈希，但客户端缺少 bcrypt 依赖。请执行 `pip install bcrypt` 后重试。"
-                )
-            if not bcrypt.checkpw(password.encode("utf-8"), stored_secret.encode("utf-8")):
+                ) from exc
+            # bcrypt校验耗时按2^cost指数增长；cost过高时提示服务端重哈希
+            try:
+                cost = int(stored_bytes.split(b"$")[2])
+                max_cost = int(_cfg("SUPABASE_BCRYPT_MAX_COST", "12"))
+                if cost > max_cost:
+                    logger.warning(
+                        "⚠️ bcrypt cost=%d 偏高（建议 <=%d），每次登录校验约慢 %d 倍，"
+                        "建议在服务端以更低cost重新哈希。",
+                        cost,
+                        max_cost,
+                        2 ** (cost - max_cost),
+                    )
+            except (IndexError, ValueError):  # pragma: no cover - 非标准哈希前缀
+                pass
+            if not bcrypt.checkpw(password.encode("utf-8"), stored_bytes):
                 raise ClientAuthorizationError("授权密码错误，请重新输入。")
             return
 
-        if stored_secret != password:
+        if not hmac.compare_digest(stored_bytes, password.encode("utf-8")):
             raise ClientAuthorizationError("授权密码错误，请重新输入。")
 
     def _build_state(
@@ -242,9 +404,9 @@ class ClientAuthorizationManager:
 
         status_value = record.get(self.status_column, "active")
         normalized_status = str(status_value).strip().lower()
-        if normalized_status in {"disabled", "inactive", "false", "0"}:
+        if normalized_status in self._DISABLED_STATUSES:
             raise ClientAuthorizationError("授权账号已被禁用，请联系管理员。")
-        if normalized_status not in {"active", "enabled", "true", "1"}:
+        if normalized_status not in self._ACTIVE_STATUSES:
             raise ClientAuthorizationError("无法识别的账号状态，请联系管理员。")
         canonical_status = "active"
 
@@ -268,9 +430,11 @@ class ClientAuthorizationManager:
     def _is_state_valid_for_today(
         self, state: AuthorizationState, now: datetime
     ) -> bool:
+        # 许可未到期且距上次校验不超过刷新间隔即视为有效；
+        # 不再按日历日切换强制重新校验，跨天启动不必多打一次Supabase
         if state.expires_at <= now:
             return False
-        return state.validated_at.date() == now.date()
+        return (now - state.validated_at) < self.refresh_interval
 
     @staticmethod
     def _require_env(name: str) -> str:
@@ -280,16 +444,33 @@ class ClientAuthorizationManager:
         return value
 
 
+# Python 3.11+ 的 fromisoformat 原生接受 'Z' 后缀，无需字符串拼接
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_str(text: str) -> datetime:
+    """Parse an ISO-8601 string into an aware UTC datetime.
+
+    The same ``expires_at``/``validated_at`` strings are parsed repeatedly
+    across state loads within one process; string -> datetime conversion is
+    pure, so an ``lru_cache`` turns repeats into a dict lookup.
+    """
+    if not _FROMISO_HANDLES_Z and text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
 def _parse_datetime(value: Any) -> datetime:
+    if isinstance(value, str):
+        return _parse_iso_str(value.strip())
     if isinstance(value, datetime):
         dt = value
     elif isinstance(value, (int, float)):
         dt = datetime.fromtimestamp(value, tz=UTC)
-    elif isinstance(value, str):
-        text = value.strip()
-        if text.endswith("Z"):
-            text = text[:-1] + "+00:00"
-        dt = datetime.fromisoformat(text)
     else:  # pragma: no cover - defensive
         raise ClientAuthorizationError(f"无法解析日期时间：{value!r}")
 
@@ -298,45 +479,28 @@ def _parse_datetime(value: Any) -> datetime:
     return dt.astimezone(UTC)
 
 
-_AUTHORIZATION_CONFIRMED = False
+@lru_cache(maxsize=1)
+def _ensure_authorized_once() -> AuthorizationState:
+    return ClientAuthorizationManager().ensure_authorized()
 
 
 def ensure_client_authorized() -> AuthorizationState:
-    """Module-level helper to ensure authorization is performed once per run."""
-
-    global _AUTHORIZATION_CONFIRMED
-    if _AUTHORIZATION_CONFIRMED:
-        if _CACHED_STATE is None:
-            raise ClientAuthorizationError("授权状态不可用。")
-        return _CACHED_STATE
-
-    manager = ClientAuthorizationManager()
-    state = manager.ensure_authorized()
-    _AUTHORIZATION_CONFIRMED = True
-    _cache_state(state)
-    return state
-
-
-_CACHED_STATE: Optional[AuthorizationState] = None
+    """Module-level helper to ensure authorization is performed once per run.
 
+    成功结果由 ``lru_cache(maxsize=1)`` 缓存（单次属性查找、线程安全）；
+    失败抛出的异常不会被缓存，下次调用会重新验证。
+    """
 
-def _cache_state(state: AuthorizationState) -> None:
-    global _CACHED_STATE
-    _CACHED_STATE = state
+    return _ensure_authorized_once()
 
 
 def _authorization_state_path() -> Path:
-    base_dir = Path(__file__).resolve().parent
-    project_root = base_dir.parent
-    state_dir = project_root / "data" / "auth_states"
-    state_dir.mkdir(parents=True, exist_ok=True)
-    return state_dir / ClientAuthorizationManager.STATE_FILENAME
+    _DEFAULT_STATE_DIR.mkdir(parents=True, exist_ok=True)
+    return _DEFAULT_STATE_DIR / ClientAuthorizationManager.STATE_FILENAME
 
 
 def reset_client_authorization_cache() -> None:
-    global _AUTHORIZATION_CONFIRMED, _CACHED_STATE
-    _AUTHORIZATION_CONFIRMED = False
-    _CACHED_STATE = None
+    _ensure_authorized_once.cache_clear()
 
 
 def logout_client_authorization(remove_cached_state: bool = True) -> bool:
@@ -5,6 +5,7 @@ Contains all configuration settings and constants
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
 class Config:
@@ -98,6 +99,7 @@ config_map = {
     "production": ProductionConfig
 }
 
+@lru_cache(maxsize=4)
 def get_config(environment: str = "development") -> Config:
     """Get configuration based on environment"""
     return config_map.get(environment, Config)
\ No newline at end of file
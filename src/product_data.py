@@ -42,6 +42,14 @@ class ProductData:
         """添加产品详情 - 简单的键值对操作"""
         if key and value:
             self.details[key.strip().lower()] = value.strip()
+
+    def add_details(self, mapping: Dict[str, str]) -> None:
+        """批量添加产品详情 - 一次dict.update替代逐键方法调用"""
+        self.details.update({
+            key.strip().lower(): value.strip()
+            for key, value in mapping.items()
+            if key and value
+        })
     
     def get_detail(self, key: str, default: str = "") -> str:
         """获取产品详情"""